@@ -6,6 +6,52 @@ import traceback # For printing tracebacks
 
 # Import necessary functions from utils
 from .utils import log_to_file, clean_thinking_tags
+from . import llm_cache
+
+def probe_model(config, timeout=5):
+    """
+    Cheap pre-flight check of the selected LLM endpoint: sends a 1-token
+    completion with a short timeout so an unreachable or misconfigured API
+    fails the run in seconds instead of after minutes of scraping.
+    Returns True if the endpoint looks usable.
+    """
+    model_config = config.get("selected_model_config")
+    if not model_config:
+        log_to_file("Model probe failed: selected_model_config missing.")
+        return False
+    api_key = model_config.get("api_key")
+    api_endpoint = model_config.get("api_endpoint")
+    if not api_key or not api_endpoint:
+        log_to_file("Model probe failed: api_key or api_endpoint missing in model config.")
+        return False
+
+    if api_endpoint.endswith("/chat/completions"):
+        full_api_url = api_endpoint
+    else:
+        full_api_url = api_endpoint.rstrip('/') + "/chat/completions"
+    headers = {"Authorization": f"Bearer {api_key}", "Content-Type": "application/json"}
+    payload = {
+        "model": model_config.get("model"),
+        "messages": [{"role": "user", "content": "ping"}],
+        "max_tokens": 1,
+    }
+    http = config.get("http_session") or requests
+    try:
+        response = http.post(full_api_url, headers=headers, json=payload, timeout=timeout)
+        response.raise_for_status()
+        response.json()
+        log_to_file(f"Model probe succeeded for endpoint {api_endpoint}.")
+        return True
+    except requests.exceptions.HTTPError as e:
+        # A rate-limited endpoint is alive; don't fail the whole run over it
+        if e.response.status_code == 429:
+            log_to_file("Model probe hit rate limit (429); treating endpoint as reachable.")
+            return True
+        log_to_file(f"Model probe failed for endpoint {api_endpoint} (HTTP {e.response.status_code}): {e}")
+        return False
+    except (requests.exceptions.RequestException, ValueError) as e:
+        log_to_file(f"Model probe failed for endpoint {api_endpoint}: {e}")
+        return False
 
 def call_ai_api(prompt, config, tool_name="General", timeout=300):
     """Generic function to call the OpenAI-compatible API."""
@@ -57,6 +103,22 @@ def call_ai_api(prompt, config, tool_name="General", timeout=300):
          log_to_file("API Call Error: 'model' key missing in payload.")
          return None, None
 
+    # Consult the exact-match response cache before paying for the API call.
+    # Identical payloads (model + messages + params) across reruns return the
+    # stored response instantly; misses are stored on success below.
+    cache_key = None
+    if config.get("llm_cache"):
+        cache_key = llm_cache.make_key(config.get("final_model_key"), payload)
+        cached_content = llm_cache.get(cache_key)
+        if cached_content is not None:
+            print(f"{tool_name} response served from LLM cache.")
+            log_to_file(f"LLM cache hit for {tool_name} (key {cache_key[:12]}...).")
+            return cached_content, clean_thinking_tags(cached_content)
+
+    # Use the run-wide pooled session when available (falls back to the bare
+    # module for callers like app.py that pass a minimal config)
+    http = config.get("http_session") or requests
+
     log_to_file(f"API Call Details:\nEndpoint: {api_endpoint}\nPayload: {json.dumps(payload, indent=2)}")
 
     try:
@@ -66,7 +128,7 @@ def call_ai_api(prompt, config, tool_name="General", timeout=300):
         else:
              full_api_url = api_endpoint.rstrip('/') + "/chat/completions"
 
-        response = requests.post(full_api_url, headers=headers, json=payload, timeout=timeout)
+        response = http.post(full_api_url, headers=headers, json=payload, timeout=timeout)
         response.raise_for_status()
 
         result = response.json()
@@ -78,6 +140,8 @@ def call_ai_api(prompt, config, tool_name="General", timeout=300):
         if message_content is None: raise ValueError("'content' field is missing in the message.") # Check for None specifically
 
         print(f"{tool_name} response received.")
+        if cache_key:
+            llm_cache.put(cache_key, message_content)
         cleaned_message = clean_thinking_tags(message_content)
         return message_content, cleaned_message
 
@@ -102,7 +166,7 @@ def call_ai_api(prompt, config, tool_name="General", timeout=300):
             time.sleep(wait_time)
             print(f"Retrying {tool_name} request...")
             try:
-                response = requests.post(full_api_url, headers=headers, json=payload, timeout=timeout)
+                response = http.post(full_api_url, headers=headers, json=payload, timeout=timeout)
                 response.raise_for_status()
                 result = response.json()
                 log_to_file(f"Raw API Response (Retry Attempt):\n{json.dumps(result, indent=2)}")
@@ -111,6 +175,8 @@ def call_ai_api(prompt, config, tool_name="General", timeout=300):
                 message_content = result["choices"][0]["message"].get("content")
                 if message_content is None: raise ValueError("'content' field is missing in the message (Retry).")
                 print(f"{tool_name} response received (after retry).")
+                if cache_key:
+                    llm_cache.put(cache_key, message_content)
                 cleaned_message = clean_thinking_tags(message_content)
                 return message_content, cleaned_message
             except requests.exceptions.RequestException as retry_e:
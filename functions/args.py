@@ -59,6 +59,8 @@ def parse_arguments(models_config):
     parser.add_argument("--per-keyword-results", type=int, default=None, help="Web results per keyword (defaults to max-web-results).")
     parser.add_argument("--combine-keywords", action="store_true", help="Treat keywords as one search query.")
     parser.add_argument("--score-threshold", type=int, default=5, help="Minimum summary score (0-10) to include in report context.")
+    parser.add_argument("--max-summaries-in-report", type=int, default=50, help="Max number of top-scoring summaries to include in the report prompt.")
+    parser.add_argument("--min-sources", type=int, default=10, help="Minimum direct article URLs (combined with reference docs) considered sufficient to skip AI source discovery.")
     parser.add_argument("--guidance", type=str, default=None, help="Additional guidance/instructions string for the LLM report generation prompts.")
     parser.add_argument("--direct-articles", type=str, default=None, help="Path to a text file containing a list of article URLs (one per line) to scrape directly.")
     parser.add_argument("--no-search", action="store_true", help="Skip AI source discovery and web search APIs. Requires --direct-articles OR --reference-docs OR --reference-docs-folder.")
@@ -67,6 +69,7 @@ def parse_arguments(models_config):
     parser.add_argument("--reference-docs-folder", type=str, default=None, help="Path to a folder containing reference documents (txt, pdf, docx).")
     # Added argument to skip refinement
     parser.add_argument("--skip_refinement", action="store_true", help="Skip the final report refinement step.")
+    parser.add_argument("--no-pdf", action="store_true", help="Skip PDF generation entirely and produce only the markdown report (useful for CI).")
 
     parser.add_argument("--no-reddit", action="store_true", help="Exclude Reddit sources from discovery and scraping.")
     # Add --report argument from new_script_builder.py
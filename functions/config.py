@@ -1,5 +1,7 @@
 import os
 import yaml
+import requests
+from requests.adapters import HTTPAdapter, Retry
 from dotenv import load_dotenv
 import json # Needed for logging config
 
@@ -25,10 +27,25 @@ def load_config(script_dir):
         log_to_file("Warning: .env file not found.")
 
 
+    # Shared HTTP session for the whole run: one connection pool means the TLS
+    # handshake (~80-150ms on a cold host) is paid once per host instead of
+    # once per request across discovery, search APIs, and LLM calls. Retries
+    # only cover idempotent methods (GET/HEAD); POSTs keep their own handling.
+    http_session = requests.Session()
+    http_adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64,
+                               max_retries=Retry(total=3, backoff_factor=0.3,
+                                                 status_forcelist=(502, 503, 504)))
+    http_session.mount('https://', http_adapter)
+    http_session.mount('http://', http_adapter)
+
     config = {
         "google_api_key": os.getenv("GOOGLE_API_KEY"),
         "google_cse_id": os.getenv("GOOGLE_CSE_ID"),
         "brave_api_key": os.getenv("BRAVE_API_KEY"),
+        # Opt-in exact-match cache for LLM responses (see functions/llm_cache.py)
+        "llm_cache": os.getenv("LLM_CACHE", "").strip().lower() in ("1", "true", "yes"),
+        # Reused by all HTTP callers that receive this config (see above)
+        "http_session": http_session,
     }
 
     # --- Load Model Configurations ---
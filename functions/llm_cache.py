@@ -0,0 +1,63 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+# Import log_to_file from utils
+from .utils import log_to_file
+
+# Exact-match KV cache for LLM responses, keyed by a hash of the full request
+# payload (model key + messages + sampling params). Repeat runs with identical
+# prompts skip the API round-trip entirely. Enabled via the llm_cache config
+# toggle (LLM_CACHE env var, see load_config).
+_CACHE_DB_PATH = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')), 'archive', '_cache', 'llm_cache.sqlite3')
+_conn = None
+_conn_lock = threading.Lock()
+
+
+def _get_conn():
+    """Returns the shared sqlite connection, creating the DB on first use."""
+    global _conn
+    if _conn is None:
+        with _conn_lock:
+            if _conn is None:
+                os.makedirs(os.path.dirname(_CACHE_DB_PATH), exist_ok=True)
+                conn = sqlite3.connect(_CACHE_DB_PATH, check_same_thread=False)
+                conn.execute("CREATE TABLE IF NOT EXISTS llm_cache (key TEXT PRIMARY KEY, response BLOB, ts INTEGER)")
+                conn.commit()
+                _conn = conn
+    return _conn
+
+
+def make_key(model_key, payload):
+    """Builds the cache key: sha256 over model key + canonicalized payload."""
+    canonical = json.dumps({"model_key": model_key, "payload": payload}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def get(key):
+    """Returns the cached response text for a key, or None on miss/error."""
+    try:
+        conn = _get_conn()
+        with _conn_lock:
+            row = conn.execute("SELECT response FROM llm_cache WHERE key = ?", (key,)).fetchone()
+        if row is not None:
+            response = row[0]
+            return response.decode('utf-8') if isinstance(response, bytes) else response
+    except sqlite3.Error as e:
+        log_to_file(f"Warning: LLM cache read failed: {e}")
+    return None
+
+
+def put(key, response):
+    """Stores a response under a key (best-effort; errors are only logged)."""
+    try:
+        conn = _get_conn()
+        with _conn_lock:
+            conn.execute("INSERT OR REPLACE INTO llm_cache (key, response, ts) VALUES (?, ?, ?)",
+                         (key, response, int(time.time())))
+            conn.commit()
+    except sqlite3.Error as e:
+        log_to_file(f"Warning: LLM cache write failed: {e}")
@@ -1,17 +1,255 @@
 import os
 import datetime
+import hashlib # For the rendered-PDF cache key
+import heapq
+import io
 import json
+import shutil # For copying cached PDF renders into place
+import random # For retry backoff jitter
 import re
+import subprocess # For the optional pagedjs-cli PDF engine
+import tempfile # For handing HTML to external PDF engines
+import threading # For serializing WeasyPrint renders
 import time
 import markdown # For converting markdown to HTML
-import pdfkit # For converting HTML to PDF
-import platform # For OS-specific checks
+import jinja2 # For the cached HTML shell template
 import traceback # For printing tracebacks
+from concurrent.futures import ThreadPoolExecutor # For background PDF rendering
 
 # Import necessary functions from utils and ai
 from ..utils import log_to_file, clean_thinking_tags, parse_ai_tool_response, get_run_archive_dir
 from ..ai import call_ai_api
 
+# --- Cached Markdown/HTML machinery ---
+# Constructing markdown.Markdown re-initializes the extension registry on every
+# call, and the HTML shell never changes between reports. Build both once at
+# import and reuse them (reset() clears converter state between documents).
+_HTML_SHELL = '''
+<html>
+<head>
+    <meta charset="UTF-8">
+    <style>
+        @page {
+            size: Letter landscape;
+            margin: 0.75in;
+        }
+        body {
+            font-family: Arial, sans-serif;
+            max-width: 100%;
+            margin: 0;
+            padding: 20px;
+            line-height: 1.6;
+            font-size: 12px;
+        }
+        h1, h2, h3, h4, h5, h6 {
+            color: #2c3e50;
+            margin-top: 24px;
+            margin-bottom: 12px;
+            page-break-after: avoid;
+        }
+        h1 {
+            border-bottom: 2px solid #2c3e50;
+            padding-bottom: 10px;
+            font-size: 20px;
+        }
+        h2 { font-size: 18px; }
+        h3 { font-size: 16px; }
+        h4 { font-size: 14px; }
+        ul, ol {
+            margin-left: 20px;
+            margin-bottom: 16px;
+            padding-left: 0;
+        }
+        li {
+            margin-bottom: 6px;
+            line-height: 1.5;
+            page-break-inside: avoid;
+        }
+        ul li { list-style-type: disc; }
+        ul ul li { list-style-type: circle; }
+        ul ul ul li { list-style-type: square; }
+        p {
+            margin-bottom: 12px;
+            line-height: 1.6;
+        }
+        code {
+            background: #f8f9fa;
+            padding: 2px 6px;
+            border-radius: 3px;
+            font-family: 'Courier New', monospace;
+            font-size: 11px;
+            color: #e83e8c;
+            word-wrap: break-word;
+        }
+        pre {
+            background: #f8f9fa;
+            padding: 12px;
+            border-radius: 6px;
+            overflow-x: auto;
+            margin-bottom: 16px;
+        }
+        blockquote {
+            border-left: 4px solid #2c3e50;
+            margin-left: 0;
+            padding-left: 20px;
+            margin-bottom: 16px;
+            font-style: italic;
+        }
+        strong {
+            font-weight: bold;
+            color: #2c3e50;
+        }
+        .table-responsive {
+            overflow-x: auto;
+            -webkit-overflow-scrolling: touch;
+        }
+
+        /* Extra safety: force tables to break words if they overflow */
+        table td, table th {
+            word-break: break-all;
+        }
+        table {
+            border-collapse: collapse;
+            width: 100%;
+            margin-bottom: 16px;
+            table-layout: fixed;
+        }
+        th, td {
+            border: 1px solid #ddd;
+            padding: 8px;
+            text-align: left;
+            word-wrap: break-word;
+            overflow-wrap: break-word;
+            word-break: break-word;
+            hyphens: auto;
+        }
+        th {
+            background-color: #f8f9fa;
+            font-weight: bold;
+        }
+        .table-responsive { overflow-x: auto; -webkit-overflow-scrolling: touch; }
+        .page-break { page-break-before: always; }
+    </style>
+</head>
+<body>
+    {{ body }}
+</body>
+</html>
+'''
+
+_MD_CONVERTER = markdown.Markdown(extensions=[
+    'extra',      # Includes tables, fenced code blocks, etc.
+    'codehilite', # Syntax highlighting for code blocks
+    'toc',        # Table of contents
+    'nl2br'       # Convert newlines to <br> tags
+], output_format='html5')
+
+# Prefer markdown-it-py when available: it is considerably faster than
+# pure-Python Markdown on large reports and avoids its pathological cases on
+# HTML-heavy input. The gfm-like preset covers tables/strikethrough and
+# breaks=True matches the nl2br behavior above. The warmup render surfaces
+# missing optional deps (linkify-it-py) at import so we fall back cleanly.
+try:
+    from markdown_it import MarkdownIt
+    _MD_IT_CONVERTER = MarkdownIt("gfm-like", {"breaks": True, "html": True})
+    _MD_IT_CONVERTER.render("*warmup*")
+except Exception:
+    _MD_IT_CONVERTER = None
+
+def _render_markdown_to_html(markdown_content):
+    """Renders markdown to HTML with the fastest available converter."""
+    if _MD_IT_CONVERTER is not None:
+        return _MD_IT_CONVERTER.render(markdown_content)
+    # reset() clears per-document state like the TOC between conversions
+    return _MD_CONVERTER.reset().convert(markdown_content)
+
+_HTML_TEMPLATE = jinja2.Template(_HTML_SHELL)
+
+# WeasyPrint imports are deferred: its pip package installs without the native
+# Pango/Cairo stack and only raises OSError at import time, which would kill
+# startup for every run — including --no-pdf and PDF_ENGINE=pagedjs runs that
+# never touch it. _ensure_weasyprint() populates these names on first use.
+HTML = None
+_FONT_CONFIG = None
+
+# WeasyPrint/Pango/fontconfig are not documented thread-safe, and the shared
+# _FONT_CONFIG must not be mutated by two renders at once (same class of
+# problem as the pdfium lock in scraping/documents.py), so in-process renders
+# are serialized; pagedjs renders are separate subprocesses and stay parallel.
+_weasyprint_lock = threading.Lock()
+
+def _ensure_weasyprint():
+    """Imports WeasyPrint and builds the shared FontConfiguration on first use."""
+    global HTML, _FONT_CONFIG
+    if HTML is not None:
+        return
+    from weasyprint import HTML as _HTML
+    from weasyprint.text.fonts import FontConfiguration as _FontConfiguration
+    HTML = _HTML
+    # WeasyPrint rebuilds its font database (a fontconfig scan costing
+    # hundreds of ms) for every write_pdf call unless given a
+    # FontConfiguration to reuse. One run renders at least twice
+    # (initial + refined report), so share one.
+    _FONT_CONFIG = _FontConfiguration()
+
+# Background workers used to overlap PDF rendering with LLM waits; two so a
+# still-running initial-report render never delays queueing the refined-report
+# render (WeasyPrint renders themselves serialize on _weasyprint_lock; pagedjs
+# renders and the markdown/HTML prep still overlap).
+_PDF_EXECUTOR = ThreadPoolExecutor(max_workers=2)
+
+# Rendered-PDF cache: unchanged markdown (per engine) reuses the previous
+# render instead of paying the full conversion cost again on reruns.
+_PDF_CACHE_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')), 'archive', '_cache')
+
+def _pdf_cache_path(markdown_content, pdf_engine):
+    """Returns the cache file path for a (markdown, engine) pair."""
+    digest = hashlib.sha256(f"{pdf_engine}\n{markdown_content}".encode('utf-8')).hexdigest()
+    return os.path.join(_PDF_CACHE_DIR, f"pdf_{digest}.pdf")
+
+def _pdf_cache_put(cache_path, pdf_path):
+    """Copies a freshly rendered PDF into the cache (atomic tmp+rename)."""
+    try:
+        os.makedirs(_PDF_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        shutil.copyfile(pdf_path, tmp_path)
+        os.replace(tmp_path, cache_path)
+    except (IOError, OSError) as cache_e:
+        log_to_file(f"Warning: PDF render cache write failed: {cache_e}")
+
+def _retry_backoff_delay(attempt, base_delay=2.0, max_delay=30.0):
+    """
+    Exponential backoff with jitter for AI retry loops: base * 2^attempt,
+    randomized up to +50% so concurrent retries don't hit the endpoint in
+    lockstep, capped at max_delay.
+    """
+    return min(max_delay, base_delay * (2 ** attempt) * (1 + random.uniform(0, 0.5)))
+
+def _render_pdf_pagedjs(styled_html, pdf_path):
+    """
+    Renders HTML to PDF by shelling out to pagedjs-cli. Considerably faster
+    than WeasyPrint on long reports, but requires the Node CLI to be on PATH.
+    Returns True on success, False otherwise (caller falls back to WeasyPrint).
+    """
+    html_tmp = None
+    try:
+        with tempfile.NamedTemporaryFile('w', suffix='.html', encoding='utf-8', delete=False) as tf:
+            tf.write(styled_html)
+            html_tmp = tf.name
+        result = subprocess.run(["pagedjs-cli", html_tmp, "-o", pdf_path],
+                                capture_output=True, text=True, timeout=300)
+        if result.returncode == 0 and os.path.isfile(pdf_path):
+            return True
+        log_to_file(f"pagedjs-cli failed (exit {result.returncode}): {result.stderr.strip()[:500]}")
+        return False
+    except (OSError, subprocess.SubprocessError) as e:
+        log_to_file(f"pagedjs-cli unavailable or errored: {e}")
+        return False
+    finally:
+        if html_tmp:
+            try: os.remove(html_tmp)
+            except OSError: pass
+
 def generate_report(summaries_with_scores, reference_docs_content, topic, config, args):
     """Uses AI to generate the initial research report."""
     print("\n--- Starting Initial Report Generation ---")
@@ -24,14 +262,26 @@ def generate_report(summaries_with_scores, reference_docs_content, topic, config
     top_summaries = [] # Initialize top_summaries to ensure it's always defined
 
     if valid_summaries:
-        top_summaries = sorted(valid_summaries, key=lambda x: x['score'], reverse=True) # Assign here if summaries exist
+        # Only the top-K summaries fit in the prompt, so select them with
+        # heapq.nlargest (O(N log K)) instead of fully sorting the list
+        max_summaries = getattr(args, 'max_summaries_in_report', 50)
+        top_summaries = heapq.nlargest(max_summaries, valid_summaries, key=lambda x: x['score'])
+        num_summaries_used = len(top_summaries)
+        if num_summaries_used < len(valid_summaries):
+            print(f"Note: Capping report context at top {num_summaries_used} of {len(valid_summaries)} valid summaries (--max-summaries-in-report).")
+            log_to_file(f"Report Gen: Capped summaries at top {num_summaries_used} of {len(valid_summaries)} (--max-summaries-in-report={max_summaries}).")
         print(f"Using {num_summaries_used} summaries (score >= {args.score_threshold}) for report generation.")
         log_to_file(f"Report Gen: Using {num_summaries_used} summaries meeting score threshold {args.score_threshold}.")
-        combined_summaries_text = "\n\n".join([
+        # Build incrementally via StringIO instead of materializing a list of
+        # formatted strings first - halves peak memory for large summary sets
+        summaries_buf = io.StringIO()
+        for i, s in enumerate(top_summaries):
+            if i > 0:
+                summaries_buf.write("\n\n")
             # Use source_id which now correctly holds URL for scraped items or path for reference docs
-            f"Summary {i+1} (Source: {s['source_id']}, Type: {s['type']}, Score: {s['score']}):\n{s['summary']}"
-            for i, s in enumerate(top_summaries)
-        ])
+            summaries_buf.write(f"Summary {i+1} (Source: {s['source_id']}, Type: {s['type']}, Score: {s['score']}):\n")
+            summaries_buf.write(s['summary'])
+        combined_summaries_text = summaries_buf.getvalue()
     else:
          print(f"Warning: No valid summaries met the score threshold ({args.score_threshold}) for report generation.")
          log_to_file(f"Report Gen Warning: No valid summaries met score threshold {args.score_threshold}.")
@@ -43,11 +293,15 @@ def generate_report(summaries_with_scores, reference_docs_content, topic, config
         num_ref_docs_used = len(reference_docs_content)
         print(f"Including {num_ref_docs_used} full reference documents directly in the report prompt.")
         log_to_file(f"Report Gen: Including {num_ref_docs_used} full reference documents.")
-        full_reference_docs_text = "\n\n---\n\n".join([
-            f"Reference Document (Path: {doc['path']}):\n{doc['content']}"
-            for doc in reference_docs_content
-        ])
-        full_reference_docs_text = f"**Full Reference Documents (Use for context):**\n---\n{full_reference_docs_text}\n---"
+        ref_docs_buf = io.StringIO()
+        ref_docs_buf.write("**Full Reference Documents (Use for context):**\n---\n")
+        for doc_idx, doc in enumerate(reference_docs_content):
+            if doc_idx > 0:
+                ref_docs_buf.write("\n\n---\n\n")
+            ref_docs_buf.write(f"Reference Document (Path: {doc['path']}):\n")
+            ref_docs_buf.write(doc['content'])
+        ref_docs_buf.write("\n---")
+        full_reference_docs_text = ref_docs_buf.getvalue()
 
     if num_summaries_used == 0 and num_ref_docs_used == 0:
          print("Error: No summaries or reference documents available to generate report.")
@@ -96,21 +350,28 @@ def generate_report(summaries_with_scores, reference_docs_content, topic, config
     # --- Parse and Save Initial Report ---
     report_text = None
     max_retries = 3
-    retry_delay = 5
+    # Strip thinking tags once per response - the result is reused for the
+    # parse comparison and the failure logging below (multi-MB responses make
+    # repeated regex scans noticeable)
+    cleaned_tagless = clean_thinking_tags(cleaned_response)
 
     for attempt in range(max_retries):
         report_text = parse_ai_tool_response(cleaned_response, "reportContent")
 
         # Check if parsing failed or returned nothing *or* returned the full response
-        if not report_text or report_text == clean_thinking_tags(cleaned_response):
+        if not report_text or report_text == cleaned_tagless:
             if attempt < max_retries - 1:  # If we still have retries left
+                # Exponential backoff with jitter: malformed output often means
+                # the endpoint is overloaded, so give it progressively more room
+                retry_delay = _retry_backoff_delay(attempt)
                 print(f"\nWarning: Could not parse <reportContent> tag (Attempt {attempt + 1}/{max_retries})")
-                print(f"Waiting {retry_delay} seconds before retry...")
-                log_to_file(f"Report Gen Warning: Parse attempt {attempt + 1} failed, retrying in {retry_delay}s")
+                print(f"Waiting {retry_delay:.1f} seconds before retry...")
+                log_to_file(f"Report Gen Warning: Parse attempt {attempt + 1} failed, retrying in {retry_delay:.1f}s")
                 time.sleep(retry_delay)
 
                 # Try generating the report again
                 raw_response, cleaned_response = call_ai_api(prompt, config, tool_name=f"ReportGeneration_Retry_{attempt + 1}", timeout=3000)
+                cleaned_tagless = clean_thinking_tags(cleaned_response)
 
                 if not cleaned_response:
                     print(f"\nError: Failed to get API response on retry {attempt + 1}")
@@ -118,11 +379,11 @@ def generate_report(summaries_with_scores, reference_docs_content, topic, config
                     continue
             else:  # Last attempt failed
                 print("\nError: Could not parse valid <reportContent> after all retry attempts.")
-                log_to_file(f"Report Gen Error: Failed to parse <reportContent> tag after {max_retries} attempts.\nLast Response:\n{clean_thinking_tags(cleaned_response)}")
+                log_to_file(f"Report Gen Error: Failed to parse <reportContent> tag after {max_retries} attempts.\nLast Response:\n{cleaned_tagless}")
                 if run_archive_dir:
                     failed_report_path = os.path.join(run_archive_dir, "report_INITIAL_FAILED_PARSE.txt")
                     try:
-                        with open(failed_report_path, 'w', encoding='utf-8') as frf: frf.write(clean_thinking_tags(cleaned_response) or "Original cleaned response was empty.")
+                        with open(failed_report_path, 'w', encoding='utf-8') as frf: frf.write(cleaned_tagless or "Original cleaned response was empty.")
                     except IOError: pass
                 return None, None, None  # Return None for path, content, and summaries list
         else:  # Successfully parsed content
@@ -186,17 +447,32 @@ def generate_report(summaries_with_scores, reference_docs_content, topic, config
 
 
 def convert_markdown_to_pdf(markdown_content, pdf_path):
-    """Convert markdown content to PDF using pdfkit/wkhtmltopdf."""
+    """
+    Convert markdown content to PDF. The engine is selected via the PDF_ENGINE
+    environment variable: 'weasyprint' (default, in-process) or 'pagedjs'
+    (pagedjs-cli subprocess, noticeably faster on long reports; falls back to
+    WeasyPrint if the CLI is missing or fails).
+    """
     print(f"\nAttempting to convert markdown to PDF: {pdf_path}")
     log_to_file(f"Attempting to convert markdown to PDF: {pdf_path}")
+    pdf_engine = os.environ.get('PDF_ENGINE', 'weasyprint').strip().lower()
+
+    # Reuse a previous render if this exact markdown was already converted
+    # with the same engine (common on reruns with the LLM cache enabled)
+    cache_path = _pdf_cache_path(markdown_content, pdf_engine)
+    if os.path.isfile(cache_path):
+        try:
+            shutil.copyfile(cache_path, pdf_path)
+            print("  - PDF served from render cache.")
+            log_to_file(f"PDF Conversion: Served from render cache ({cache_path}).")
+            return True
+        except IOError as cache_e:
+            log_to_file(f"Warning: PDF render cache read failed, re-rendering: {cache_e}")
+
     try:
-        # Convert markdown to HTML with extensions for better formatting
-        html_content = markdown.markdown(markdown_content, extensions=[
-            'extra',      # Includes tables, fenced code blocks, etc.
-            'codehilite', # Syntax highlighting for code blocks
-            'toc',        # Table of contents
-            'nl2br'       # Convert newlines to <br> tags
-        ])
+        # Convert markdown to HTML (markdown-it-py when installed, else the
+        # cached Python-Markdown converter)
+        html_content = _render_markdown_to_html(markdown_content)
 
         # Use BeautifulSoup to parse HTML and add spaces before strong tags if needed
         from bs4 import BeautifulSoup
@@ -225,169 +501,40 @@ def convert_markdown_to_pdf(markdown_content, pdf_path):
         # Get the modified HTML back
         modified_html_content = str(soup)
 
-        # Add improved styling for better PDF formatting
-        styled_html = f'''
-<html>
-<head>
-    <meta charset="UTF-8">
-    <style>
-        body {{
-            font-family: Arial, sans-serif;
-            max-width: 100%;
-            margin: 0;
-            padding: 20px;
-            line-height: 1.6;
-            font-size: 12px;
-        }}
-        h1, h2, h3, h4, h5, h6 {{
-            color: #2c3e50;
-            margin-top: 24px;
-            margin-bottom: 12px;
-            page-break-after: avoid;
-        }}
-        h1 {{
-            border-bottom: 2px solid #2c3e50;
-            padding-bottom: 10px;
-            font-size: 20px;
-        }}
-        h2 {{ font-size: 18px; }}
-        h3 {{ font-size: 16px; }}
-        h4 {{ font-size: 14px; }}
-        ul, ol {{
-            margin-left: 20px;
-            margin-bottom: 16px;
-            padding-left: 0;
-        }}
-        li {{
-            margin-bottom: 6px;
-            line-height: 1.5;
-            page-break-inside: avoid;
-        }}
-        ul li {{ list-style-type: disc; }}
-        ul ul li {{ list-style-type: circle; }}
-        ul ul ul li {{ list-style-type: square; }}
-        p {{
-            margin-bottom: 12px;
-            line-height: 1.6;
-        }}
-        code {{
-            background: #f8f9fa;
-            padding: 2px 6px;
-            border-radius: 3px;
-            font-family: 'Courier New', monospace;
-            font-size: 11px;
-            color: #e83e8c;
-            word-wrap: break-word;
-        }}
-        pre {{
-            background: #f8f9fa;
-            padding: 12px;
-            border-radius: 6px;
-            overflow-x: auto;
-            margin-bottom: 16px;
-        }}
-        blockquote {{
-            border-left: 4px solid #2c3e50;
-            margin-left: 0;
-            padding-left: 20px;
-            margin-bottom: 16px;
-            font-style: italic;
-        }}
-        strong {{
-            font-weight: bold;
-            color: #2c3e50;
-        }}
-        .table-responsive {{
-            overflow-x: auto;
-            -webkit-overflow-scrolling: touch;
-        }}
-
-        /* Extra safety: force tables to break words if they overflow */
-        table td, table th {{
-            word-break: break-all;
-        }}
-        table {{
-            border-collapse: collapse;
-            width: 100%;
-            margin-bottom: 16px;
-            table-layout: fixed;
-        }}
-        th, td {{
-            border: 1px solid #ddd;
-            padding: 8px;
-            text-align: left;
-            word-wrap: break-word;
-            overflow-wrap: break-word;
-            word-break: break-word;
-            hyphens: auto;
-        }}
-        th {{
-            background-color: #f8f9fa;
-            font-weight: bold;
-        }}
-        .table-responsive {{ overflow-x: auto; -webkit-overflow-scrolling: touch; }}
-        .page-break {{ page-break-before: always; }}
-    </style>
-</head>
-<body>
-    {modified_html_content}
-</body>
-</html>
-'''
-
-        # PDF conversion options with improved formatting
-        options = {
-            'page-size': 'Letter',
-            'orientation': 'Landscape',
-            'margin-top': '0.75in',
-            'margin-right': '0.75in',
-            'margin-bottom': '0.75in',
-            'margin-left': '0.75in',
-            'encoding': 'UTF-8',
-            'no-outline': None,
-            'enable-local-file-access': None,
-            'print-media-type': None,
-            'disable-smart-shrinking': None,
-            'zoom': '0.9'
-        }
-
+        # Wrap in the precompiled HTML shell for better PDF formatting
+        styled_html = _HTML_TEMPLATE.render(body=modified_html_content)
+
+        # Optional faster engine: pagedjs-cli renders long reports several
+        # times faster than WeasyPrint. Opt in with PDF_ENGINE=pagedjs.
+        if pdf_engine == 'pagedjs':
+            if _render_pdf_pagedjs(styled_html, pdf_path):
+                print("  - PDF conversion successful using pagedjs-cli.")
+                log_to_file("PDF Conversion: Successful using pagedjs-cli.")
+                _pdf_cache_put(cache_path, pdf_path)
+                return True
+            print("  - pagedjs-cli failed; falling back to WeasyPrint.")
+            log_to_file("PDF Conversion: pagedjs-cli failed, falling back to WeasyPrint.")
+
+        # Render the PDF in-process with WeasyPrint (no external wkhtmltopdf
+        # process to spawn, no platform-specific binary paths to probe)
         try:
-            # Try with installed wkhtmltopdf first
-            pdfkit.from_string(styled_html, pdf_path, options=options)
-            print("  - PDF conversion successful using default wkhtmltopdf path.")
-            log_to_file("PDF Conversion: Successful using default wkhtmltopdf path.")
-            return True
-        except OSError as e_initial:
-            # If wkhtmltopdf is not in PATH, try explicit Windows path ONLY if on Windows
-            if platform.system() == "Windows":
-                try:
-                    print("  - wkhtmltopdf not found in PATH, attempting default Windows path...")
-                    log_to_file("PDF Conversion: wkhtmltopdf not in PATH, trying C:\\Program Files\\wkhtmltopdf\\bin\\wkhtmltopdf.exe")
-                    config = pdfkit.configuration(wkhtmltopdf='C:\\Program Files\\wkhtmltopdf\\bin\\wkhtmltopdf.exe')
-                    pdfkit.from_string(styled_html, pdf_path, options=options, configuration=config)
-                    print("  - Successfully used wkhtmltopdf from default Windows path.")
-                    log_to_file("PDF Conversion: Success using default Windows path.")
-                    return True # Success using fallback
-                except OSError as e_fallback:
-                    # Fallback also failed
-                    print(f"  - Default Windows path for wkhtmltopdf also failed: {e_fallback}")
-                    log_to_file(f"PDF Conversion Error: Default Windows path failed: {e_fallback}")
-                    # Fall through to the general exception handling below
-                    raise e_fallback # Re-raise the error from the fallback attempt
-            else:
-                # Not on Windows, so the initial OSError means it's not installed/in PATH
-                print(f"  - wkhtmltopdf not found in PATH (OS: {platform.system()}).")
-                log_to_file(f"PDF Conversion Error: wkhtmltopdf not found in PATH (OS: {platform.system()}). Initial error: {e_initial}")
-                raise e_initial # Re-raise the original error
-
-        # This line should technically not be reached if exceptions are raised correctly
-        return True # Should be unreachable if exception occurs, but needed for structure
+            _ensure_weasyprint()
+        except (ImportError, OSError) as weasy_e:
+            print(f"  - WeasyPrint unavailable: {weasy_e}")
+            print("    Install its system libraries (Pango/Cairo/GDK-PixBuf) via settings/Installer.sh,")
+            print("    or set PDF_ENGINE=pagedjs, or rerun with --no-pdf for markdown-only output.")
+            log_to_file(f"PDF Conversion Failed: WeasyPrint unavailable: {weasy_e}")
+            return False
+        with _weasyprint_lock:
+            HTML(string=styled_html).write_pdf(pdf_path, font_config=_FONT_CONFIG)
+        print("  - PDF conversion successful using WeasyPrint.")
+        log_to_file("PDF Conversion: Successful using WeasyPrint.")
+        _pdf_cache_put(cache_path, pdf_path)
+        return True
     except Exception as e:
-        # Catch any exception during conversion (including re-raised OSErrors)
         print(f"PDF conversion failed: {e}")
         log_to_file(f"PDF Conversion Failed: {e}")
-        print("Please ensure wkhtmltopdf is installed and accessible in your system's PATH.")
-        print("Download from: https://wkhtmltopdf.org/downloads.html")
+        print("Please ensure WeasyPrint and its system libraries (Pango/Cairo) are installed.")
         return False
 
 
@@ -401,6 +548,34 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
         log_to_file("Refinement Error: Initial report content was empty.")
         return None # Cannot refine nothing
 
+    # Kick off PDF rendering of the initial report in the background so it
+    # overlaps with the (multi-second) refinement LLM call below.
+    initial_pdf_future = None
+    initial_pdf_path = None
+    skip_pdf = getattr(args, 'no_pdf', False)
+    if skip_pdf:
+        print("Skipping PDF generation (--no-pdf).")
+        log_to_file("PDF generation disabled via --no-pdf; producing markdown only.")
+    run_archive_dir = get_run_archive_dir()
+    if run_archive_dir and not skip_pdf:
+        initial_pdf_path = os.path.join(run_archive_dir, "research_report_initial_raw.pdf")
+        initial_pdf_future = _PDF_EXECUTOR.submit(convert_markdown_to_pdf, initial_report_content, initial_pdf_path)
+
+        def _log_initial_pdf_done(done_future):
+            """Logs the background render's outcome when it actually finishes."""
+            try:
+                if done_future.result():
+                    log_to_file(f"Background PDF render of initial report finished: {initial_pdf_path}")
+                # convert_markdown_to_pdf logs its own failure details on False
+            except Exception as pdf_bg_e:
+                log_to_file(f"Background PDF render of initial report failed: {pdf_bg_e}")
+
+        # Logging via callback instead of blocking on result(): long reports
+        # routinely render for over a minute, and the refinement steps below
+        # don't need the initial PDF at all.
+        initial_pdf_future.add_done_callback(_log_initial_pdf_done)
+        log_to_file(f"Started background PDF render of initial report: {initial_pdf_path}")
+
     # --- Build References String for Refinement Prompt ---
     references_section_for_prompt = "## References\n"
     ref_counter = 1
@@ -433,35 +608,37 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
     # --- End Build References String ---
 
     # --- Construct Refinement Prompt ---
-    refinement_prompt = (
-        f"You are an AI assistant specializing in document presentation and formatting.\n"
-        f"**Task:** Refine the following research report text to significantly improve its presentation for a supervisor. Focus on enhancing readability, structure, scannability, and visual appeal using standard text formatting. The topic is '{topic}'.\n\n"
-        f"**Refinement Instructions:**\n"
-        f"1.  **Executive Summary:** Add a concise (2-4 sentence) 'Executive Summary' or 'Key Takeaways' section at the very beginning, summarizing the report's core findings.\n"
-        f"2.  **Headings/Subheadings:** Ensure clear, descriptive headings (e.g., using markdown-style `#`, `##`, `###`) for sections like Introduction, different Body themes, Conclusion, and the References section.\n"
-        f"3.  **Lists:** Convert dense paragraph descriptions of items, steps, pros/cons, or methods into bulleted (`*` or `-`) or numbered lists. Ensure each list item is on its own line, preceded by a blank line if it follows a paragraph.\n"
-        f"4.  **Tables (Optional but Recommended):** If the text compares multiple methods, items, or data points (e.g., different acquisition methods with costs/limits), try to structure this into a simple markdown table for easy comparison. If a table is not feasible, use parallel bullet points under clear subheadings.\n"
-        f"5.  **Paragraphs:** Break down long paragraphs into shorter, more focused ones, each addressing a single idea.\n"
-        f"6.  **Bolding:** Use bold text (`**text**`) strategically and sparingly for key terms or crucial conclusions within sentences, not entire sentences.\n"
-        f"7.  **Clarity & Flow:** Ensure smooth transitions and logical flow between sections.\n"
-        f"8.  **Remove Inline Citations:** CRITICAL - Remove all inline parenthetical citations like `(Summary X)` or `(Summary X, Y)` from the body of the report.\n"
-        f"9.  **Add References Section:** Append the following 'References' section exactly as provided at the VERY END of the report, after the conclusion.\n"
-        f"10. **No New Content:** Do NOT add information not present in the original text. Focus *only* on restructuring, formatting, removing inline citations, and adding the provided References section.\n\n"
-        f"**Original Report Text to Refine:**\n"
-        f"--- START ORIGINAL REPORT ---\n"
-        f"{initial_report_content}\n"
-        f"--- END ORIGINAL REPORT ---\n\n"
-        f"**References Section to Add at the End:**\n"
-        f"--- START REFERENCES ---\n"
-        f"{references_section_for_prompt}"
-        f"--- END REFERENCES ---\n\n"
-        f"**CRITICAL OUTPUT FORMAT:** Enclose the *entire* refined report (including the added References section) within a single pair of `<refinedReport>` tags. ONLY include the refined report text inside these tags. NO other text, remarks, or explanations outside the tags.\n"
-        f"<refinedReport>" # Start the tag
-    )
-    refinement_prompt += "\n</refinedReport>" # End the tag
+    # Assembled via "".join so the multi-MB report body is never copied into
+    # intermediate concatenation results (str.join allocates once)
+    refinement_parts = [
+        "You are an AI assistant specializing in document presentation and formatting.\n",
+        f"**Task:** Refine the following research report text to significantly improve its presentation for a supervisor. Focus on enhancing readability, structure, scannability, and visual appeal using standard text formatting. The topic is '{topic}'.\n\n",
+        "**Refinement Instructions:**\n",
+        "1.  **Executive Summary:** Add a concise (2-4 sentence) 'Executive Summary' or 'Key Takeaways' section at the very beginning, summarizing the report's core findings.\n",
+        "2.  **Headings/Subheadings:** Ensure clear, descriptive headings (e.g., using markdown-style `#`, `##`, `###`) for sections like Introduction, different Body themes, Conclusion, and the References section.\n",
+        "3.  **Lists:** Convert dense paragraph descriptions of items, steps, pros/cons, or methods into bulleted (`*` or `-`) or numbered lists. Ensure each list item is on its own line, preceded by a blank line if it follows a paragraph.\n",
+        "4.  **Tables (Optional but Recommended):** If the text compares multiple methods, items, or data points (e.g., different acquisition methods with costs/limits), try to structure this into a simple markdown table for easy comparison. If a table is not feasible, use parallel bullet points under clear subheadings.\n",
+        "5.  **Paragraphs:** Break down long paragraphs into shorter, more focused ones, each addressing a single idea.\n",
+        "6.  **Bolding:** Use bold text (`**text**`) strategically and sparingly for key terms or crucial conclusions within sentences, not entire sentences.\n",
+        "7.  **Clarity & Flow:** Ensure smooth transitions and logical flow between sections.\n",
+        "8.  **Remove Inline Citations:** CRITICAL - Remove all inline parenthetical citations like `(Summary X)` or `(Summary X, Y)` from the body of the report.\n",
+        "9.  **Add References Section:** Append the following 'References' section exactly as provided at the VERY END of the report, after the conclusion.\n",
+        "10. **No New Content:** Do NOT add information not present in the original text. Focus *only* on restructuring, formatting, removing inline citations, and adding the provided References section.\n\n",
+        "**Original Report Text to Refine:**\n",
+        "--- START ORIGINAL REPORT ---\n",
+        initial_report_content,
+        "\n--- END ORIGINAL REPORT ---\n\n",
+        "**References Section to Add at the End:**\n",
+        "--- START REFERENCES ---\n",
+        references_section_for_prompt,
+        "--- END REFERENCES ---\n\n",
+        "**CRITICAL OUTPUT FORMAT:** Enclose the *entire* refined report (including the added References section) within a single pair of `<refinedReport>` tags. ONLY include the refined report text inside these tags. NO other text, remarks, or explanations outside the tags.\n",
+        "<refinedReport>", # Start the tag
+        "\n</refinedReport>", # End the tag
+    ]
+    refinement_prompt = "".join(refinement_parts)
 
     # Save refinement prompt
-    run_archive_dir = get_run_archive_dir()
     if run_archive_dir:
         ref_prompt_filename = os.path.join(run_archive_dir, "report_prompt_refinement.txt")
         try:
@@ -472,6 +649,9 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
     # --- Call AI for Refinement ---
     raw_response, cleaned_response = call_ai_api(refinement_prompt, config, tool_name="ReportRefinement", timeout=1200) # Allow decent time
 
+    # The background initial-report PDF render keeps going on its own; its
+    # done-callback above logs the outcome whenever it finishes.
+
     # Save raw refinement response
     if run_archive_dir and raw_response:
         ref_raw_resp_filename = os.path.join(run_archive_dir, "report_response_refinement_raw.txt")
@@ -488,21 +668,26 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
     # --- Parse Refined Report ---
     refined_report_text = None
     max_retries = 3
-    retry_delay = 5
+    # As in generate_report: strip thinking tags once per response rather than
+    # re-scanning in the comparison, failure log and failure dump
+    cleaned_tagless = clean_thinking_tags(cleaned_response)
 
     for attempt in range(max_retries):
         refined_report_text = parse_ai_tool_response(cleaned_response, "refinedReport")
 
         # Check if parsing failed or returned nothing *or* returned the full response
-        if not refined_report_text or refined_report_text == clean_thinking_tags(cleaned_response):
+        if not refined_report_text or refined_report_text == cleaned_tagless:
             if attempt < max_retries - 1:  # If we still have retries left
+                # Same backoff-with-jitter policy as the initial report loop
+                retry_delay = _retry_backoff_delay(attempt)
                 print(f"\nWarning: Could not parse <refinedReport> tag (Attempt {attempt + 1}/{max_retries})")
-                print(f"Waiting {retry_delay} seconds before retry...")
-                log_to_file(f"Refinement Warning: Parse attempt {attempt + 1} failed, retrying in {retry_delay}s")
+                print(f"Waiting {retry_delay:.1f} seconds before retry...")
+                log_to_file(f"Refinement Warning: Parse attempt {attempt + 1} failed, retrying in {retry_delay:.1f}s")
                 time.sleep(retry_delay)
 
                 # Try refining the report again
                 raw_response, cleaned_response = call_ai_api(refinement_prompt, config, tool_name=f"ReportRefinement_Retry_{attempt + 1}", timeout=1200)
+                cleaned_tagless = clean_thinking_tags(cleaned_response)
 
                 if not cleaned_response:
                     print(f"\nError: Failed to get API response on refinement retry {attempt + 1}")
@@ -510,11 +695,11 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
                     continue
             else:  # Last attempt failed
                 print("\nWarning: Could not parse valid <refinedReport> content after all retry attempts. Skipping refinement.")
-                log_to_file(f"Refinement Warning: Failed to parse <refinedReport> tag after {max_retries} attempts.\nLast Response:\n{clean_thinking_tags(cleaned_response)}")
+                log_to_file(f"Refinement Warning: Failed to parse <refinedReport> tag after {max_retries} attempts.\nLast Response:\n{cleaned_tagless}")
                 if run_archive_dir:
                     failed_ref_report_path = os.path.join(run_archive_dir, "report_REFINED_FAILED_PARSE.txt")
                     try:
-                        with open(failed_ref_report_path, 'w', encoding='utf-8') as frf: frf.write(clean_thinking_tags(cleaned_response) or "Original cleaned response was empty.")
+                        with open(failed_ref_report_path, 'w', encoding='utf-8') as frf: frf.write(cleaned_tagless or "Original cleaned response was empty.")
                     except IOError: pass
                 return None  # Indicate refinement failed
         else:  # Successfully parsed content
@@ -540,14 +725,38 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
         markdown_filepath = os.path.join(final_output_dir, f"{base_filename}.md")
         pdf_filepath = os.path.join(final_output_dir, f"{base_filename}.pdf")
 
-        # Save markdown version
-        with open(markdown_filepath, 'w', encoding='utf-8') as ff:
-            ff.write(refined_report_text)
+        # Start the PDF conversion in the background, then write the markdown
+        # while it renders - the two outputs are independent, so the markdown
+        # fsync overlaps with the (dominant) PDF rendering cost.
+        pdf_future = None
+        if not skip_pdf:
+            pdf_future = _PDF_EXECUTOR.submit(convert_markdown_to_pdf, refined_report_text, pdf_filepath)
+
+        # Save markdown version. Encode once and push the bytes through a raw
+        # fd - one write syscall for typical reports instead of the buffered
+        # text-layer's encode/flush churn (the loop only re-enters on the rare
+        # partial write the OS is allowed to return).
+        markdown_bytes = refined_report_text.encode('utf-8')
+        # O_BINARY (Windows-only, 0 elsewhere) keeps the CRT from
+        # LF-to-CRLF-translating the bytes, which would also break the
+        # write-count arithmetic below
+        fd = os.open(markdown_filepath, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+        try:
+            view = memoryview(markdown_bytes)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
         log_to_file(f"Saved refined report markdown to: {markdown_filepath}")
 
-        # Convert to PDF
+        if skip_pdf:
+            print(f"Successfully saved refined report (markdown only, --no-pdf):\nMarkdown: {markdown_filepath}")
+            log_to_file(f"Refined report saved as markdown only (--no-pdf): {markdown_filepath}")
+            return [markdown_filepath]
+
+        # Collect the PDF conversion result
         try:
-            pdf_success = convert_markdown_to_pdf(refined_report_text, pdf_filepath)
+            pdf_success = pdf_future.result(timeout=600)
             if pdf_success:
                 print(f"Successfully saved refined report as:\nMarkdown: {markdown_filepath}\nPDF: {pdf_filepath}")
                 log_to_file(f"Refined report saved successfully as markdown and PDF:\n{markdown_filepath}\n{pdf_filepath}")
@@ -566,13 +775,24 @@ def refine_report_presentation(initial_report_content, top_summaries, reference_
         print(f"\nError: Could not save refined report to output directory: {e}")
         log_to_file(f"Refinement Saving Error: Failed to save refined report to output directory: {e}")
         # Also save to archive as fallback if possible
-        run_archive_dir = get_run_archive_dir()
         if run_archive_dir:
             fallback_filename = os.path.join(run_archive_dir, f"refined_report_FALLBACK_{timestamp}.txt")
             try:
-                 with open(fallback_filename, 'w', encoding='utf-8') as fbf: fbf.write(refined_report_text)
+                 # If the markdown itself was written before the failure, a
+                 # hardlink shares its inode instead of serializing the report
+                 # a second time; fall back to a real write otherwise (e.g.
+                 # archive on a different filesystem, or markdown never saved)
+                 linked = False
+                 if 'markdown_filepath' in locals() and os.path.isfile(markdown_filepath):
+                     try:
+                         os.link(markdown_filepath, fallback_filename)
+                         linked = True
+                     except OSError:
+                         pass
+                 if not linked:
+                     with open(fallback_filename, 'w', encoding='utf-8') as fbf: fbf.write(refined_report_text)
                  print(f"Saved refined report to archive as fallback: {fallback_filename}")
-                 log_to_file(f"Refinement Saving Fallback: Saved refined report to {fallback_filename}")
+                 log_to_file(f"Refinement Saving Fallback: Saved refined report to {fallback_filename}{' (hardlink)' if linked else ''}")
             except IOError as e_fb:
                  log_to_file(f"Refinement Saving Fallback Error: Could not save to archive fallback: {e_fb}")
         return None # Indicate saving failed
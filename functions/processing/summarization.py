@@ -1,18 +1,81 @@
 import os
+import atexit
 import re
 import time
 import random
 import json
+import queue
+import threading
 import traceback # For printing tracebacks
+from concurrent.futures import ThreadPoolExecutor, as_completed # For parallel LLM calls
 
 # Import necessary functions from utils and ai
 from ..utils import log_to_file, clean_thinking_tags, parse_ai_tool_response, get_run_archive_dir
 from ..ai import call_ai_api
 
+# Fast-path pattern matching a well-formed summary + score response in a
+# single scan, instead of separate tag search / empty check / score regex
+# passes over the same (potentially large) response text.
+_COMBINED_SUMMARY_RE = re.compile(
+    r"<toolScrapeSummary>(.*?)</toolScrapeSummary>\s*<summaryScore>(\d{1,2})</summaryScore>",
+    re.IGNORECASE | re.DOTALL)
+
+# --- Background archive writer ---
+# Per-summary archive files were written inline on the main thread, adding a
+# blocking open/write/close per item. A single daemon thread drains a queue of
+# (path, payload) pairs instead so the summarization loop never waits on disk.
+_archive_write_q = queue.Queue()
+_archive_writer_started = False
+
+def _archive_writer():
+    """Daemon worker: writes queued (filepath, payload) archive entries."""
+    while True:
+        filepath, payload = _archive_write_q.get()
+        try:
+            with open(filepath, 'w', encoding='utf-8') as sf:
+                sf.write(payload)
+        except IOError as e:
+            log_to_file(f"Warning: Could not save summary archive file {filepath}: {e}")
+        finally:
+            _archive_write_q.task_done()
+
+def _queue_archive_write(filepath, payload):
+    """Queues an archive file write for the background writer thread."""
+    global _archive_writer_started
+    if not _archive_writer_started:
+        threading.Thread(target=_archive_writer, daemon=True).start()
+        _archive_writer_started = True
+    _archive_write_q.put((filepath, payload))
+
+def _drain_archive_writes():
+    """Blocks until all queued archive writes have been flushed to disk (registered atexit)."""
+    if _archive_writer_started:
+        _archive_write_q.join()
+
+atexit.register(_drain_archive_writes)
+
+def _make_progress_printer(min_interval=0.2):
+    """
+    Returns a '\\r' status printer that only flushes stdout when at least
+    min_interval seconds have passed since the last update. Each flushed
+    update is a blocking write syscall, so throttling keeps the hot
+    summarization loop from spending its time on terminal I/O.
+    """
+    last_flush = [0.0]
+    def update(message, force=False):
+        now = time.monotonic()
+        if force or (now - last_flush[0]) >= min_interval:
+            print(f"\r{message}", end='', flush=True)
+            last_flush[0] = now
+    return update
+
 def summarize_content(scraped_data, reference_docs, topic, config, args):
     """
     Uses AI to summarize scraped content and optionally reference documents,
-    assigning a relevance score to each.
+    assigning a relevance score to each. Summary and score are produced by a
+    single fused LLM call per piece (the prompt requests both the
+    <toolScrapeSummary> and <summaryScore> tags), so scoring never costs a
+    second round-trip.
     """
     print(f"\n--- Starting Summarization & Scoring Phase ---")
     log_to_file("Starting summarization and scoring phase.")
@@ -55,8 +118,13 @@ def summarize_content(scraped_data, reference_docs, topic, config, args):
     log_to_file(f"Starting summarization for {total_pieces} piece(s). Topic: {topic}")
     summaries_with_scores = []
     successful_summaries = 0
+    progress = _make_progress_printer()
 
-    for i, item in enumerate(content_to_process, 1):
+    def _summarize_item(i, item):
+        """
+        Summarizes and scores one content piece; runs on a worker thread.
+        Returns (summary_details or None if the piece was skipped, success flag).
+        """
         text = item["content"]
         item_type = item["type"]
         # Determine the source identifier based on type
@@ -70,11 +138,8 @@ def summarize_content(scraped_data, reference_docs, topic, config, args):
 
         # Basic check for meaningful content length
         if len(text) < 100:
-            print(f"\rSkipping summary for short text piece {i}/{total_pieces} ({item_source_id}).", end='', flush=True)
             log_to_file(f"Summary {i}/{total_pieces} ({item_source_id}) skipped (too short: {len(text)} chars).")
-            continue
-
-        print(f"\rSummarizing & Scoring {i}/{total_pieces} ({item_type}: {os.path.basename(str(item_source_id))[:30]}...) (Success: {successful_summaries})", end='', flush=True)
+            return None, False
 
         # Truncate potentially very long texts (adjust limit based on model context window)
         # Get max_tokens from model config if available, estimate input capacity
@@ -109,13 +174,11 @@ def summarize_content(scraped_data, reference_docs, topic, config, args):
         retry_delay = 5 # seconds
         summary = "Error: Summarization Failed (Unknown)"
         score = -1
-        summary_details = {"type": item_type, "source_id": item_source_id} # Store type and source id
+        succeeded = False
         raw_response = None
         cleaned_response = None
 
         for attempt in range(max_retries):
-            print(f"\rSummarizing & Scoring {i}/{total_pieces} ({item_type}: {os.path.basename(str(item_source_id))[:30]}...) (Attempt {attempt + 1}/{max_retries}) (Success: {successful_summaries})", end='', flush=True)
-
             # Use a reasonable timeout for summarization
             raw_response, cleaned_response = call_ai_api(prompt, config, tool_name=f"Summary_{i}_{item_type}_Attempt{attempt+1}", timeout=180)
 
@@ -125,7 +188,25 @@ def summarize_content(scraped_data, reference_docs, topic, config, args):
                 score = -1
                 break # No point retrying if API call fails
 
-            # Try parsing
+            # Fast path: well-formed responses match summary + score in one
+            # pass. Keep the *last* match to mirror parse_ai_tool_response's
+            # rfind semantics - models sometimes emit a draft pair before the
+            # final one, and the final pair is the authoritative answer.
+            combined_match = None
+            for combined_match in _COMBINED_SUMMARY_RE.finditer(cleaned_response):
+                pass
+            if combined_match and combined_match.group(1).strip():
+                summary = combined_match.group(1).strip()
+                parsed_score = int(combined_match.group(2))
+                if 0 <= parsed_score <= 10:
+                    score = parsed_score
+                    succeeded = True
+                else:
+                    log_to_file(f"Warning: Summary {i} ({item_source_id}) score '{parsed_score}' out of range (0-10). Using -1.")
+                    score = -1 # Treat out-of-range score as invalid for threshold check later
+                break # Parsed successfully, exit retry loop
+
+            # Fallback: malformed/partial responses go through the tag-by-tag parser
             parsed_summary = parse_ai_tool_response(cleaned_response, "toolScrapeSummary")
 
             # Check for the specific error: tag missing
@@ -159,7 +240,7 @@ def summarize_content(scraped_data, reference_docs, topic, config, args):
                         parsed_score = int(score_match.group(1))
                         if 0 <= parsed_score <= 10:
                             score = parsed_score
-                            successful_summaries += 1 # Increment here on successful parse + score
+                            succeeded = True # Counted by the dispatch loop on successful parse + score
                         else:
                             log_to_file(f"Warning: Summary {i} ({item_source_id}) score '{parsed_score}' out of range (0-10). Using -1.")
                             score = -1 # Treat out-of-range score as invalid for threshold check later
@@ -177,19 +258,51 @@ def summarize_content(scraped_data, reference_docs, topic, config, args):
 
         # --- End Retry Logic ---
 
-        summary_details = {"type": item_type, "source_id": item_source_id, 'summary': summary, 'score': score} # Recreate dict with all details
-        summaries_with_scores.append(summary_details)
+        summary_details = {"type": item_type, "source_id": item_source_id, 'summary': summary, 'score': score}
 
         # Use the getter function for run_archive_dir
         run_archive_dir = get_run_archive_dir()
         if run_archive_dir:
             safe_source_id = re.sub(r'[\\/*?:"<>|]', "_", str(item_source_id).replace(os.path.sep, '_')) # Sanitize path separators too
             summary_filename = os.path.join(run_archive_dir, f"summary_{i}_{item_type}_{safe_source_id[:50]}.txt")
+            _queue_archive_write(summary_filename, f"Source: {item_source_id}\nType: {item_type}\nScore: {score}\n\n{summary}")
+
+        return summary_details, succeeded
+
+    # Summarization is embarrassingly parallel across pieces and dominated by
+    # API round-trip time, so dispatch the per-item LLM calls to a bounded
+    # thread pool (call_ai_api is synchronous). SUMMARIZATION_CONCURRENCY
+    # tunes the fan-out to match provider rate limits.
+    max_workers = max(1, min(int(os.getenv("SUMMARIZATION_CONCURRENCY", "4")), total_pieces))
+    results = [None] * total_pieces
+    completed = 0
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_idx = {executor.submit(_summarize_item, i, item): i - 1
+                         for i, item in enumerate(content_to_process, 1)}
+        for future in as_completed(future_to_idx):
+            idx = future_to_idx[future]
             try:
-                with open(summary_filename, 'w', encoding='utf-8') as sf:
-                    sf.write(f"Source: {item_source_id}\nType: {item_type}\nScore: {score}\n\n{summary}")
-            except IOError as e:
-                log_to_file(f"Warning: Could not save summary {i} ({item_source_id}) to file {summary_filename}: {e}")
+                details, succeeded = future.result()
+            except Exception as sum_e:
+                log_to_file(f"Summarization Error: Unexpected error for piece {idx + 1}: {sum_e}")
+                details = {"type": content_to_process[idx]["type"], "source_id": f"Piece_{idx + 1}",
+                           'summary': f"Error: Summarization failed unexpectedly ({sum_e})", 'score': -1}
+                succeeded = False
+            completed += 1
+            if succeeded:
+                successful_summaries += 1
+            if details is not None:
+                results[idx] = details
+            progress(f"Summarizing & Scoring: {completed}/{total_pieces} pieces done (Success: {successful_summaries})")
+
+    # Keep the returned summaries in the original piece order (skipped
+    # short pieces simply drop out, matching the old serial behavior)
+    summaries_with_scores = [r for r in results if r is not None]
+
+    # Archive writes keep draining in the background while report generation
+    # starts; the atexit hook guarantees they land on disk before the process
+    # exits. Report generation only reads the in-memory summaries, so nothing
+    # downstream waits on those files.
 
     print(f"\rSummarization & Scoring complete. Generated {successful_summaries}/{total_pieces} summaries successfully (with valid scores).")
     log_to_file(f"Summarization phase complete. Successful summaries (with score): {successful_summaries}/{total_pieces}")
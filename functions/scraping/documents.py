@@ -1,12 +1,81 @@
 import os
-import PyPDF2 # Renamed from pypdf - assuming PyPDF2 is intended or needs update
-import docx
+import atexit
+import hashlib
+import multiprocessing
 import platform # For OS-specific checks
-import pandas as pd
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import partial
+
+# Heavy parsers (pypdfium2, docx, pandas, charset_normalizer) are imported
+# lazily inside the file-type branches that need them, keeping cold start
+# fast for runs that never touch those formats.
 
 # Import log_to_file from utils
 from ..utils import log_to_file
 
+# Minimum page count before PDF text extraction is farmed out to worker
+# processes; below this the process-spawn overhead outweighs the win.
+_PDF_PARALLEL_MIN_PAGES = 20
+
+# pdfium is not thread-safe and pypdfium2 adds no locking of its own, while
+# load_document runs in worker threads when several documents load at once.
+# Every in-process pdfium call must hold this lock; the large-PDF page
+# extraction is exempt because each pool worker owns a private pdfium copy.
+_pdfium_lock = threading.Lock()
+
+# Process-wide worker pool, created lazily on the first large PDF and reused
+# for every one after it, so the 100-400ms per-worker spawn cost is paid once
+# per run instead of once per document. Uses forkserver where available
+# (Linux) to keep even that first spawn cheap.
+_pdf_pool = None
+_pdf_pool_lock = threading.Lock()
+
+def _get_pdf_pool():
+    """Returns the shared ProcessPoolExecutor for PDF page extraction."""
+    global _pdf_pool
+    if _pdf_pool is None:
+        with _pdf_pool_lock:
+            if _pdf_pool is None:
+                try:
+                    mp_context = multiprocessing.get_context('forkserver')
+                except ValueError:
+                    mp_context = None # Platform default (spawn on macOS/Windows)
+                _pdf_pool = ProcessPoolExecutor(max_workers=min(4, os.cpu_count() or 1),
+                                                mp_context=mp_context)
+                atexit.register(_pdf_pool.shutdown)
+    return _pdf_pool
+
+# Directory for cached reference-doc extractions, keyed by a content hash of
+# (path, mtime, size). Re-running with the same documents skips the expensive
+# PDF/DOCX/Excel parsing entirely and reads the cached plain text instead.
+_REF_CACHE_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')), '.refcache')
+
+def _ref_cache_path(doc_path):
+    """Returns the cache file path for a document, or None if it can't be stat'd."""
+    try:
+        stat = os.stat(doc_path)
+        key = hashlib.blake2b(f"{doc_path}|{stat.st_mtime}|{stat.st_size}".encode('utf-8')).hexdigest()
+        return os.path.join(_REF_CACHE_DIR, f"{key}.txt")
+    except OSError:
+        return None
+
+def _extract_pdf_page(doc_path, page_num):
+    """
+    Extracts text from a single PDF page. Runs in a worker process, so the
+    PDF is re-opened per call and errors are signalled by returning None
+    (logging happens in the parent).
+    """
+    try:
+        import pypdfium2 as pdfium
+        pdf = pdfium.PdfDocument(doc_path)
+        try:
+            return pdf[page_num].get_textpage().get_text_range() or ""
+        finally:
+            pdf.close()
+    except Exception:
+        return None
+
 def load_document(doc_path):
     """Helper to load content from a single document path."""
 
@@ -15,36 +84,89 @@ def load_document(doc_path):
         log_to_file(f"Error: Reference document not found/not a file: {doc_path}")
         return None
 
+    # Check the extraction cache first; the key covers path, mtime and size,
+    # so any edit to the source document invalidates the cached text.
+    cache_path = _ref_cache_path(doc_path)
+    if cache_path and os.path.isfile(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as cf:
+                cached_content = cf.read()
+            if cached_content.strip():
+                print(f"  - Using cached extraction for: {doc_path}")
+                log_to_file(f"Reference doc cache hit: {doc_path}")
+                return {"path": doc_path, "content": cached_content}
+        except IOError as cache_e:
+            print(f"  - Warning: Could not read cached extraction for {doc_path}: {cache_e}")
+            log_to_file(f"Warning: Reference doc cache read failed for {doc_path}: {cache_e}")
+
     content = None
     file_ext = os.path.splitext(doc_path)[1].lower()
     print(f"  - Processing reference document: {doc_path}")
     log_to_file(f"Processing reference document: {doc_path}")
     try:
         if file_ext == '.pdf':
-            text_content = []
+            # Cheap encryption sniff before handing the file to pdfium: the
+            # /Encrypt entry lives in the trailer dictionary near the end of
+            # the file, so a 1KB tail read rejects protected PDFs without
+            # paying for xref/document parsing.
             try:
-                with open(doc_path, 'rb') as pdf_file:
-                    reader = PyPDF2.PdfReader(pdf_file)
-                    if reader.is_encrypted:
-                        print(f"    - Warning: Skipping encrypted PDF: {doc_path}")
-                        log_to_file(f"Warning: Skipping encrypted PDF: {doc_path}")
+                with open(doc_path, 'rb') as pf:
+                    pf.seek(0, os.SEEK_END)
+                    pf.seek(max(0, pf.tell() - 1024))
+                    if b'/Encrypt' in pf.read():
+                        print(f"  - Error: Skipping encrypted PDF: {doc_path}")
+                        log_to_file(f"Error: Skipping encrypted PDF (found /Encrypt in trailer): {doc_path}")
                         return None
-                    for page_num, page in enumerate(reader.pages):
-                        try:
-                             page_text = page.extract_text()
-                             if page_text: text_content.append(page_text)
-                        except Exception as page_e:
-                            print(f"    - Warning: Error extracting text from page {page_num+1} of {doc_path}: {page_e}")
-                            log_to_file(f"Warning: PDF page extraction error {doc_path} (Page {page_num+1}): {page_e}")
+            except IOError as tail_e:
+                # Non-fatal: fall through and let pdfium report any real problem
+                log_to_file(f"Warning: Could not sniff PDF trailer for {doc_path}: {tail_e}")
+
+            import pypdfium2 as pdfium
+
+            text_content = []
+            try:
+                # In-process pdfium work (open, page count, small-PDF page
+                # extraction) is serialized by _pdfium_lock; see its comment.
+                with _pdfium_lock:
+                    # Opening raises PdfiumError for password-protected
+                    # (encrypted) or corrupt documents, so no separate
+                    # encryption check needed
+                    pdf = pdfium.PdfDocument(doc_path)
+                    try:
+                        num_pages = len(pdf)
+                        if num_pages < _PDF_PARALLEL_MIN_PAGES:
+                            for page_num in range(num_pages):
+                                try:
+                                     page_text = pdf[page_num].get_textpage().get_text_range()
+                                     if page_text: text_content.append(page_text)
+                                except Exception as page_e:
+                                    print(f"    - Warning: Error extracting text from page {page_num+1} of {doc_path}: {page_e}")
+                                    log_to_file(f"Warning: PDF page extraction error {doc_path} (Page {page_num+1}): {page_e}")
+                    finally:
+                        pdf.close()
+                if num_pages >= _PDF_PARALLEL_MIN_PAGES:
+                    # Large PDF: page extraction dominates, so spread the
+                    # pages across worker processes for a near-linear win
+                    # (and keep the lock free while they run)
+                    print(f"    - Extracting {num_pages} PDF pages in parallel...")
+                    log_to_file(f"Extracting {num_pages} PDF pages in parallel: {doc_path}")
+                    page_texts = list(_get_pdf_pool().map(partial(_extract_pdf_page, doc_path), range(num_pages)))
+                    for page_num, page_text in enumerate(page_texts):
+                        if page_text:
+                            text_content.append(page_text)
+                        elif page_text is None:
+                            print(f"    - Warning: Error extracting text from page {page_num+1} of {doc_path}")
+                            log_to_file(f"Warning: PDF page extraction error {doc_path} (Page {page_num+1})")
                 content = "\n".join(text_content)
                 print(f"    - Extracted text from PDF.")
                 log_to_file(f"Extracted text from PDF: {doc_path}")
-            except PyPDF2.errors.PdfReadError as pdf_err:
-                 print(f"  - Error reading PDF file {doc_path}: {pdf_err}")
-                 log_to_file(f"Error reading PDF file {doc_path}: {pdf_err}")
+            except pdfium.PdfiumError as pdf_err:
+                 print(f"  - Error reading PDF file {doc_path} (encrypted or corrupt?): {pdf_err}")
+                 log_to_file(f"Error reading PDF file {doc_path} (encrypted or corrupt?): {pdf_err}")
                  return None
 
         elif file_ext == '.docx':
+            import docx
             try:
                 doc = docx.Document(doc_path)
                 text_content = [para.text for para in doc.paragraphs if para.text]
@@ -57,25 +179,24 @@ def load_document(doc_path):
                  return None
 
         elif file_ext == '.txt':
-            # Try common encodings
-            encodings_to_try = ['utf-8', 'latin-1', 'windows-1252']
-            for enc in encodings_to_try:
-                try:
-                    with open(doc_path, 'r', encoding=enc) as f:
-                        content = f.read()
-                    print(f"    - Read as plain text ({enc}).")
-                    log_to_file(f"Read as plain text ({enc}): {doc_path}")
-                    break # Stop if successful
-                except UnicodeDecodeError:
-                    continue # Try next encoding
-                except Exception as read_e: # Catch other read errors
-                     raise read_e # Re-raise other errors
+            # Read the raw bytes once and let charset_normalizer pick the
+            # encoding in a single pass (already a transitive dep of requests).
+            # Avoids re-reading the whole file per candidate encoding.
+            from charset_normalizer import from_bytes
+            with open(doc_path, 'rb') as f:
+                raw_bytes = f.read()
+            best_match = from_bytes(raw_bytes).best()
+            if best_match is not None:
+                content = str(best_match)
+                print(f"    - Read as plain text ({best_match.encoding}).")
+                log_to_file(f"Read as plain text ({best_match.encoding}): {doc_path}")
             if content is None:
-                print(f"    - Error: Could not decode text file {doc_path} with tested encodings.")
+                print(f"    - Error: Could not detect a usable encoding for text file {doc_path}.")
                 log_to_file(f"Error: Failed to decode text file {doc_path}")
                 return None
 
         elif file_ext in ['.xlsx', '.xlsm']:
+            import pandas as pd
             try:
                 # Read Excel file and convert all sheets to text
                 excel_file = pd.ExcelFile(doc_path)
@@ -117,6 +238,7 @@ def load_document(doc_path):
                 return None
 
         elif file_ext == '.csv':
+            import pandas as pd
             try:
                 # Try common encodings for CSV files
                 encodings_to_try = ['utf-8', 'latin-1', 'windows-1252']
@@ -177,6 +299,19 @@ def load_document(doc_path):
         if content and content.strip():
             print(f"    - Successfully loaded content ({len(content)} chars).")
             log_to_file(f"Loaded reference doc: {doc_path} ({len(content)} chars)")
+            # Persist the extracted text for future runs. Written to a temp
+            # file then renamed so concurrent loaders never see partial data.
+            if cache_path:
+                try:
+                    os.makedirs(_REF_CACHE_DIR, exist_ok=True)
+                    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+                    with open(tmp_path, 'w', encoding='utf-8') as cf:
+                        cf.write(content.strip())
+                    os.replace(tmp_path, cache_path)
+                    log_to_file(f"Cached reference doc extraction: {doc_path}")
+                except (IOError, OSError) as cache_e:
+                    print(f"  - Warning: Could not cache extraction for {doc_path}: {cache_e}")
+                    log_to_file(f"Warning: Reference doc cache write failed for {doc_path}: {cache_e}")
             return {"path": doc_path, "content": content.strip()}
         else:
             print(f"    - Warning: No text content extracted or file is empty.")
@@ -191,26 +326,24 @@ def load_document(doc_path):
 def load_reference_documents(args):
     """Loads reference documents from specified paths or a folder."""
     reference_docs_content = []
-    loaded_ref_paths = set() # Keep track of loaded paths to avoid duplicates
+    candidate_paths = [] # Ordered list of unique paths to load
+    loaded_ref_paths = set() # Keep track of collected paths to avoid duplicates
 
-    # Load from --reference-docs
+    # Collect from --reference-docs
     if args.reference_docs:
         print("\nLoading specified reference documents...")
         log_to_file(f"Loading specified reference documents from: {args.reference_docs}")
         ref_doc_paths = [p.strip() for p in args.reference_docs.split(',') if p.strip()]
         for doc_path in ref_doc_paths:
-            # Check if already loaded before attempting to load
+            # Check if already queued before adding
             if doc_path in loaded_ref_paths:
                 print(f"  - Skipping duplicate document path: {doc_path}")
                 log_to_file(f"Skipping duplicate reference doc path: {doc_path}")
                 continue
+            loaded_ref_paths.add(doc_path)
+            candidate_paths.append(doc_path)
 
-            doc_content = load_document(doc_path)
-            if doc_content:
-                reference_docs_content.append(doc_content)
-                loaded_ref_paths.add(doc_path) # Mark as loaded
-
-    # Load from --reference-docs-folder
+    # Collect from --reference-docs-folder
     if args.reference_docs_folder:
         print(f"\nLoading reference documents from folder: {args.reference_docs_folder}")
         log_to_file(f"Loading reference documents from folder: {args.reference_docs_folder}")
@@ -218,20 +351,38 @@ def load_reference_documents(args):
             print(f"  - Error: Provided path is not a valid directory: {args.reference_docs_folder}")
             log_to_file(f"Error: --reference-docs-folder path is not a directory: {args.reference_docs_folder}")
         else:
-            for filename in os.listdir(args.reference_docs_folder):
-                doc_path = os.path.join(args.reference_docs_folder, filename)
-                # Check if it's a file and not already loaded before processing
-                if os.path.isfile(doc_path) and doc_path not in loaded_ref_paths:
-                    doc_content = load_document(doc_path) # Use helper function
-                    if doc_content:
-                        reference_docs_content.append(doc_content)
-                        loaded_ref_paths.add(doc_path) # Mark as loaded
-                elif os.path.isfile(doc_path) and doc_path in loaded_ref_paths:
-                     print(f"  - Skipping already loaded document from folder: {doc_path}")
-                     log_to_file(f"Skipping duplicate reference doc from folder: {doc_path}")
-
-
-            log_to_file(f"Finished processing reference documents folder. Total loaded: {len(reference_docs_content)}")
+            # os.scandir exposes the file type from the directory entry itself,
+            # so no extra stat() per regular file like os.listdir +
+            # os.path.isfile; symlinks are followed to match the old behavior
+            with os.scandir(args.reference_docs_folder) as dir_entries:
+                for entry in dir_entries:
+                    if not entry.is_file():
+                        continue
+                    doc_path = entry.path
+                    if doc_path not in loaded_ref_paths:
+                        loaded_ref_paths.add(doc_path)
+                        candidate_paths.append(doc_path)
+                    else:
+                        print(f"  - Skipping already loaded document from folder: {doc_path}")
+                        log_to_file(f"Skipping duplicate reference doc from folder: {doc_path}")
+
+    # Load all collected documents in parallel: file reads and PDF/DOCX parsing
+    # are independent per file, so a thread pool overlaps disk latency with
+    # per-document extraction work.
+    if candidate_paths:
+        if len(candidate_paths) <= 2:
+            # Pool startup overhead isn't worth it for one or two documents
+            results = [load_document(p) for p in candidate_paths]
+        else:
+            max_workers = min(8, os.cpu_count() or 4)
+            results = [None] * len(candidate_paths)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                future_to_idx = {executor.submit(load_document, p): idx for idx, p in enumerate(candidate_paths)}
+                for future in as_completed(future_to_idx):
+                    results[future_to_idx[future]] = future.result()
+        # Keep results in the original path order for deterministic output
+        reference_docs_content = [doc for doc in results if doc]
+        log_to_file(f"Finished loading reference documents. Total loaded: {len(reference_docs_content)}/{len(candidate_paths)}")
 
     if not reference_docs_content and (args.reference_docs or args.reference_docs_folder):
         print("Warning: No valid reference documents were loaded despite flags being set.")
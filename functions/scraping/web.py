@@ -1,3 +1,6 @@
+import hashlib
+import json
+import os
 import requests
 import time
 import random
@@ -6,6 +9,56 @@ from newspaper import Article, ArticleException # Using newspaper4k for better w
 # Import log_to_file from utils
 from ..utils import log_to_file
 
+# Content-addressable cache of scraped pages, keyed by sha256(url). Reruns
+# with overlapping source sets skip the download+parse entirely for fresh
+# entries. TTL comes from SCRAPE_CACHE_TTL_S (seconds; 0 disables caching).
+_SCRAPE_CACHE_DIR = os.path.join(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')), 'archive', '_cache')
+_SCRAPE_CACHE_DEFAULT_TTL_S = 86400 # 1 day
+
+def _scrape_cache_ttl():
+    """Returns the scrape-cache TTL in seconds (0 disables the cache)."""
+    try:
+        return int(os.getenv('SCRAPE_CACHE_TTL_S', str(_SCRAPE_CACHE_DEFAULT_TTL_S)))
+    except ValueError:
+        return _SCRAPE_CACHE_DEFAULT_TTL_S
+
+def _scrape_cache_path(url):
+    """Returns the cache file path for a URL."""
+    return os.path.join(_SCRAPE_CACHE_DIR, f"{hashlib.sha256(url.encode('utf-8')).hexdigest()}.json")
+
+def _scrape_cache_get(url):
+    """Returns the cached scrape dict for a URL, or None on miss/stale/error."""
+    ttl = _scrape_cache_ttl()
+    if ttl <= 0:
+        return None
+    cache_path = _scrape_cache_path(url)
+    try:
+        if not os.path.isfile(cache_path):
+            return None
+        with open(cache_path, 'r', encoding='utf-8') as cf:
+            entry = json.load(cf)
+        if time.time() - entry.get('ts', 0) > ttl:
+            return None
+        if entry.get('content'):
+            return {"url": url, "content": entry['content']}
+    except (IOError, ValueError) as cache_e:
+        log_to_file(f"Warning: Scrape cache read failed for {url}: {cache_e}")
+    return None
+
+def _scrape_cache_put(url, content):
+    """Persists a successful scrape for future runs (atomic tmp+rename)."""
+    if _scrape_cache_ttl() <= 0:
+        return
+    cache_path = _scrape_cache_path(url)
+    try:
+        os.makedirs(_SCRAPE_CACHE_DIR, exist_ok=True)
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as cf:
+            json.dump({"url": url, "content": content, "ts": time.time()}, cf)
+        os.replace(tmp_path, cache_path)
+    except (IOError, OSError) as cache_e:
+        log_to_file(f"Warning: Scrape cache write failed for {url}: {cache_e}")
+
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
     'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.1.1 Safari:605.1.15',
@@ -14,6 +67,14 @@ USER_AGENTS = [
 
 def scrape_website_url(url):
     """Scrapes content from a single website URL using newspaper4k."""
+    # Serve from the disk cache when a fresh entry exists - no network fetch,
+    # no parse, and no politeness delay needed for a purely local read
+    cached = _scrape_cache_get(url)
+    if cached:
+        print(f"      - Using cached scrape for: {url}")
+        log_to_file(f"Scrape cache hit: {url}")
+        return cached
+
     print(f"      - Scraping URL (Newspaper4k): {url}")
     log_to_file(f"Scraping website URL: {url}")
     try:
@@ -36,7 +97,8 @@ def scrape_website_url(url):
             content += f"\nBody:\n{text}"
             print(f"        - Success: Scraped content ({len(text)} chars).")
             log_to_file(f"Website scrape success: {url} ({len(text)} chars)")
-            # Return dict with url and content
+            # Persist for future runs, then return dict with url and content
+            _scrape_cache_put(url, content.strip())
             return {"url": url, "content": content.strip()}
         elif text:
             print("        - Warning: Scraped text too short, skipping.")
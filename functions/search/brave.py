@@ -2,12 +2,32 @@ import requests
 import json
 import time
 import random
+import threading
 import datetime # Needed for date parsing
 import urllib.parse # Needed for URL parsing
 
 # Import log_to_file from utils
 from ..utils import log_to_file
 
+# Brave's API allows roughly 1 request/second. Concurrent callers (the
+# parallel keyword-search fan-out) must not burst past that, or transient
+# 429s get misread as quota exhaustion and results fall through to the
+# fallback API. Every Brave request is paced process-wide through this
+# lock + timestamp pair; sleeping while holding the lock is deliberate so
+# queued callers line up at the allowed rate.
+_BRAVE_MIN_INTERVAL_S = 1.1
+_rate_lock = threading.Lock()
+_last_request_ts = 0.0
+
+def _respect_rate_limit():
+    """Blocks until at least _BRAVE_MIN_INTERVAL_S has passed since the last Brave request."""
+    global _last_request_ts
+    with _rate_lock:
+        wait = _last_request_ts + _BRAVE_MIN_INTERVAL_S - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        _last_request_ts = time.monotonic()
+
 def search_brave_api(query, config, num_results, from_date=None, to_date=None):
     """Performs search using Brave Search API."""
     urls = []
@@ -45,7 +65,11 @@ def search_brave_api(query, config, num_results, from_date=None, to_date=None):
         log_to_file(f"Brave API Request Details:\n  URL: {prepared_request.url}\n  Headers: {prepared_request.headers}")
         print(f"    - Requesting URL: {prepared_request.url}") # Also print URL for easier debugging
 
-        response = requests.get(search_url, headers=headers, params=params, timeout=20)
+        # Use the run-wide pooled session when available (falls back to the
+        # bare module for callers that pass a minimal config)
+        http = config.get("http_session") or requests
+        _respect_rate_limit()
+        response = http.get(search_url, headers=headers, params=params, timeout=20)
         response.raise_for_status()
         search_data = response.json()
         log_to_file(f"Brave API Raw Response Body:\n{json.dumps(search_data, indent=2)}") # Log the raw JSON response
@@ -1,9 +1,11 @@
 import os
 import re
+import socket
 import time
 import random
 import urllib.parse
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed # For parallel DNS resolution
 
 # Import necessary functions from utils, ai, and search APIs
 from ..utils import log_to_file, parse_ai_tool_response
@@ -18,6 +20,25 @@ USER_AGENTS = [
 ]
 
 
+def _resolve_hosts_concurrently(hostnames):
+    """
+    Resolves a set of hostnames to IPs in parallel threads. Each lookup blocks
+    20-200ms, so fanning them out keeps total DNS time near max(lookup) rather
+    than sum(lookup). Returns {hostname: ip or None if resolution failed}.
+    """
+    resolved = {}
+    if not hostnames:
+        return resolved
+    with ThreadPoolExecutor(max_workers=min(16, len(hostnames))) as executor:
+        future_to_host = {executor.submit(socket.gethostbyname, h): h for h in hostnames}
+        for future in as_completed(future_to_host):
+            host = future_to_host[future]
+            try:
+                resolved[host] = future.result()
+            except OSError:
+                resolved[host] = None
+    return resolved
+
 def discover_sources(keywords_list, config, args):
     """Uses AI to discover relevant websites and subreddits."""
     print("\nDiscovering sources via AI...")
@@ -65,6 +86,18 @@ def discover_sources(keywords_list, config, args):
 
     print(f"Discovered {len(sources_list)} potential sources. Validating access...")
     log_to_file(f"Discovered {len(sources_list)} potential sources. Starting validation.")
+    # Resolve every candidate hostname up front in parallel: unresolvable
+    # hosts are rejected immediately below instead of each eating the 10s
+    # HTTP timeout, and resolvable ones warm the OS resolver cache so the
+    # serial HEAD checks skip their DNS wait entirely.
+    # hostname (not netloc) so ports or credentials in a URL don't poison the
+    # lookup — gethostbyname("example.com:8080") raises and the source would
+    # be falsely rejected below
+    candidate_hosts = {urllib.parse.urlparse(s).hostname for s in sources_list if s.startswith(('http://', 'https://'))}
+    resolved_hosts = _resolve_hosts_concurrently({h for h in candidate_hosts if h})
+    # Use the run-wide pooled session when available (falls back to the bare
+    # module for callers that pass a minimal config)
+    http = config.get("http_session") or requests
     # --- Source Validation (Optional but recommended) ---
     validated_sources = []
     for source in sources_list:
@@ -82,9 +115,15 @@ def discover_sources(keywords_list, config, args):
                 base_url = f"{parsed_uri.scheme}://{parsed_uri.netloc}/"
                 check_target_display = f"Base Domain {base_url} (from {source})" # More descriptive display
 
+                # Fail fast on hosts whose DNS lookup already failed above
+                if resolved_hosts.get(parsed_uri.hostname, True) is None:
+                    print(f"  - Checking: {check_target_display}... Failed (DNS resolution)")
+                    log_to_file(f"Source Validation: {check_target_display}... Failed (DNS resolution)")
+                    continue
+
                 print(f"  - Checking: {check_target_display}...", end="")
                 # Use base_url for the actual check
-                response = requests.head(base_url, headers={'User-Agent': random.choice(USER_AGENTS)}, timeout=10, allow_redirects=True)
+                response = http.head(base_url, headers={'User-Agent': random.choice(USER_AGENTS)}, timeout=10, allow_redirects=True)
                 if response.status_code < 400:
                     is_valid = True
                     print(f" OK (Status: {response.status_code})")
@@ -125,19 +164,20 @@ def discover_sources(keywords_list, config, args):
 def perform_direct_keyword_search(keywords_list, config, args):
     """
     Performs a direct web search for each keyword using the specified search API
-    and returns a list of unique URLs.
+    and returns a list of unique URLs. Keyword searches run concurrently: each
+    is an independent API round-trip, so total latency is ~max(RTT) instead of
+    sum(RTT) across keywords.
     """
     print("\nPerforming direct keyword web search...")
     log_to_file("Starting direct keyword web search.")
-    
-    all_found_urls = set()
-    results_limit_per_api_call = args.per_keyword_results if args.per_keyword_results else args.max_web_results # Use per-keyword limit if set, else max-web-results
 
-    for keyword_idx, keyword in enumerate(keywords_list, 1):
-        search_query = keyword.strip()
-        if not search_query:
-            continue
+    results_limit_per_api_call = args.per_keyword_results if args.per_keyword_results else args.max_web_results # Use per-keyword limit if set, else max-web-results
 
+    def _search_keyword(keyword_idx, search_query):
+        """Runs the primary/fallback API search for one keyword. Returns a list of URLs or None."""
+        # Jittered start so concurrent workers don't hit the search APIs in a
+        # single burst (replaces the old serial 1-2s inter-keyword delay)
+        time.sleep(random.uniform(0, 1))
         print(f"  - Searching for keyword {keyword_idx}/{len(keywords_list)}: '{search_query}' (Limit: {results_limit_per_api_call})")
         log_to_file(f"Direct Keyword Search: Query {keyword_idx}: '{search_query}' (Limit: {results_limit_per_api_call})")
 
@@ -185,8 +225,28 @@ def perform_direct_keyword_search(keywords_list, config, args):
                 log_to_file(f"Direct Keyword Search: Fallback API '{fallback_api}' succeeded.")
                 api_results = api_results_fallback # Use fallback results
 
-        # Add successfully found URLs
-        if isinstance(api_results, list):
+        return api_results if isinstance(api_results, list) else None
+
+    queries = [(idx, kw.strip()) for idx, kw in enumerate(keywords_list, 1) if kw.strip()]
+    results = [None] * len(queries)
+    if queries:
+        with ThreadPoolExecutor(max_workers=min(8, len(queries))) as executor:
+            future_to_pos = {executor.submit(_search_keyword, idx, query): pos
+                             for pos, (idx, query) in enumerate(queries)}
+            for future in as_completed(future_to_pos):
+                pos = future_to_pos[future]
+                try:
+                    results[pos] = future.result()
+                except Exception as e:
+                    _, query = queries[pos]
+                    print(f"    - Unexpected error searching for keyword '{query}': {e}")
+                    log_to_file(f"Direct Keyword Search: Unexpected error for query '{query}': {e}")
+
+    # Merge in original keyword order so dedup stays deterministic regardless
+    # of which search finished first
+    all_found_urls = set()
+    for (_, search_query), api_results in zip(queries, results):
+        if api_results is not None:
             added_count = 0
             for url in api_results:
                 if url not in all_found_urls:
@@ -198,8 +258,6 @@ def perform_direct_keyword_search(keywords_list, config, args):
             print(f"    - No URLs obtained from APIs for keyword '{search_query}'.")
             log_to_file(f"Direct Keyword Search Failed/Empty for keyword '{search_query}'.")
 
-        time.sleep(random.uniform(1, 2)) # Delay between API calls for different keywords
-
     final_urls = list(all_found_urls)
     print(f"\nFinished direct keyword web search. Total unique URLs found: {len(final_urls)}")
     log_to_file(f"Direct Keyword Search: Complete. Total unique URLs: {len(final_urls)}")
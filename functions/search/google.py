@@ -36,8 +36,11 @@ def search_google_api(query, config, num_results, from_date=None, to_date=None):
     if date_restrict:
         params['sort'] = date_restrict # Add sort parameter for date range
 
+    # Use the run-wide pooled session when available (falls back to the bare
+    # module for callers that pass a minimal config)
+    http = config.get("http_session") or requests
     try:
-        response = requests.get(search_url, params=params, timeout=20)
+        response = http.get(search_url, params=params, timeout=20)
         response.raise_for_status()
         search_data = response.json()
 
@@ -1,15 +1,109 @@
 import os
+import atexit
 import datetime
+import json
+import queue
 import re
+import threading
 import traceback # For printing tracebacks
 
 # Global variable for archive directory
 run_archive_dir = None
 
+# Shared compile site for the topic/filename slug pattern: non-word runs,
+# collapsed to '_' by callers (e.g. SLUG_RE.sub('_', topic)[:50])
+SLUG_RE = re.compile(r'\W+')
+
+# --- Buffered log writer ---
+# log_to_file is called for nearly every event in a run; opening, writing and
+# closing the log file per call made each log line a set of blocking syscalls
+# on the calling thread. Log lines are queued instead and a daemon thread
+# appends them in batches, with an atexit drain so nothing is lost on exit.
+_log_q = queue.Queue()
+_log_worker_started = False
+_log_worker_lock = threading.Lock()
+_LOG_BATCH_MAX = 64
+# Persistent handle owned by the writer thread: opening/closing the log per
+# batch still cost a pair of syscalls; a single buffered append handle
+# (reopened only if the run archive dir changes) removes them entirely.
+_log_fh = None
+_log_fh_path = None
+
+# Computed once in set_run_archive_dir rather than re-joined on every log
+# batch: the archive dir changes at most once per run, so the join/basename
+# work (and the stat churn it feeds) doesn't belong in the writer loop.
+_log_file_cached = None
+
+def _log_file_path():
+    """Returns the current run's log file path, or None if archiving is off."""
+    return _log_file_cached
+
+def _write_log_batch(batch):
+    """Appends a batch of preformatted log lines via the persistent handle."""
+    global _log_fh, _log_fh_path
+    log_file = _log_file_path()
+    if not log_file or not batch:
+        return
+    try:
+        if _log_fh is None or _log_fh_path != log_file:
+            if _log_fh is not None:
+                try: _log_fh.close()
+                except IOError: pass
+            _log_fh = open(log_file, 'a', encoding='utf-8', buffering=1 << 16)
+            _log_fh_path = log_file
+        _log_fh.writelines(batch)
+    except Exception as e:
+        # Broad catch: an encoding error in one log line must not take the
+        # writer down with it
+        print(f"Warning: Could not write to log file {log_file}: {e}")
+        # Silently fail if we can't write logs after warning
+
+def _log_worker():
+    """Daemon worker: drains queued log lines and writes them in batches."""
+    while True:
+        batch = [_log_q.get()]
+        while len(batch) < _LOG_BATCH_MAX:
+            try:
+                batch.append(_log_q.get_nowait())
+            except queue.Empty:
+                break
+        try:
+            _write_log_batch(batch)
+        except Exception as e:
+            print(f"Warning: Log writer error: {e}")
+        finally:
+            # task_done() must run even if the write blows up, or the atexit
+            # _flush_logs() join() would hang the process on exit
+            for _ in batch:
+                _log_q.task_done()
+
+def _ensure_log_worker():
+    """Starts the background log writer thread on first use."""
+    global _log_worker_started
+    if not _log_worker_started:
+        with _log_worker_lock:
+            if not _log_worker_started:
+                threading.Thread(target=_log_worker, daemon=True).start()
+                _log_worker_started = True
+
+def _flush_logs():
+    """Waits for all queued log lines to reach disk (registered atexit)."""
+    if _log_worker_started:
+        _log_q.join()
+    if _log_fh is not None:
+        try:
+            _log_fh.flush()
+        except IOError:
+            pass
+
+atexit.register(_flush_logs)
+
 def set_run_archive_dir(path):
-    """Sets the global run_archive_dir variable."""
-    global run_archive_dir
+    """Sets the global run_archive_dir variable (and the derived log file path)."""
+    global run_archive_dir, _log_file_cached
     run_archive_dir = path
+    # Use a consistent log filename within the archive
+    _log_file_cached = os.path.join(path, f"run_{os.path.basename(path)}.log") if path else None
 
 def get_run_archive_dir():
     """Gets the global run_archive_dir variable."""
@@ -20,14 +114,15 @@ def log_to_file(content):
     """Helper to write detailed logs to the run-specific archive directory."""
     global run_archive_dir
     if run_archive_dir:
-        # Use a consistent log filename within the archive
-        log_file = os.path.join(run_archive_dir, f"run_{os.path.basename(run_archive_dir)}.log")
-        try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(f"\n[{datetime.datetime.now().isoformat()}] {content}\n")
-        except IOError as e:
-            print(f"Warning: Could not write to log file {log_file}: {e}")
-            # Silently fail if we can't write logs after warning
+        _ensure_log_worker()
+        _log_q.put(f"\n[{datetime.datetime.now().isoformat()}] {content}\n")
+
+def _jdump(o):
+    """
+    Compact JSON serialization for log payloads: no separator whitespace and
+    default=str so nonstandard types (paths, argparse values) never raise.
+    """
+    return json.dumps(o, separators=(',', ':'), default=str)
 
 def clean_thinking_tags(text):
     """Recursively remove all content within <think>...</think> tags."""
@@ -2,18 +2,36 @@ import os
 import datetime
 import time
 import re
+import urllib.parse # For URL normalization during source dedup
 import traceback # For printing tracebacks
 import random # For random delays (used in scraping, but import here for completeness)
 
 # Import functions from the new modular structure
 from functions.config import load_config
 from functions.args import parse_arguments
+from functions.ai import probe_model
 from functions.search.discovery import discover_sources
 from functions.scraping.content import scrape_content
 from functions.scraping.documents import load_reference_documents
 from functions.processing.summarization import summarize_content
 from functions.processing.report_generation import generate_report, refine_report_presentation, convert_markdown_to_pdf
-from functions.utils import log_to_file, set_run_archive_dir, get_run_archive_dir # Import run_archive_dir setter/getter
+from functions.utils import log_to_file, set_run_archive_dir, get_run_archive_dir, _jdump, SLUG_RE # Import run_archive_dir setter/getter + compact log JSON + shared slug regex
+
+# Precompiled at import so hot paths skip the re module's cache lookup
+_URL_RE = re.compile(r'^https?://') # Quick http(s) URL check for direct-article lines
+
+def _norm_source_key(src):
+    """
+    Normalized dedup key for a source: lowercased scheme/host, trailing slash
+    and fragment stripped, so http://X.com/ and http://x.com collapse to one
+    scrape. Query strings are kept - they can identify distinct articles.
+    Non-URL sources (subreddits, bare names) just get whitespace/slash trimmed.
+    """
+    src = src.strip()
+    parts = urllib.parse.urlsplit(src)
+    if not parts.scheme or not parts.netloc:
+        return src.rstrip('/')
+    return urllib.parse.urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip('/'), parts.query, ''))
 
 # --- Main Execution ---
 
@@ -69,13 +87,13 @@ def main():
 
     # Store the final selected config back into the main config dict for use by call_ai_api
     env_config["selected_model_config"] = final_model_config # Use env_config dict
-    log_to_file(f"Final Model Config Used: {final_model_config}")
+    log_to_file(f"Final Model Config Used: {_jdump(final_model_config)}")
     # --- End Final Model Configuration Determination ---
 
 
     # Create Archive Directory for this run
     archive_base_dir = os.path.join(script_dir, "archive") # Store archive relative to script
-    topic_slug = re.sub(r'\W+', '_', args.topic)[:50] # Sanitize topic for dir name
+    topic_slug = SLUG_RE.sub('_', args.topic)[:50] # Sanitize topic for dir name
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     run_archive_dir_name = f"{timestamp}_{topic_slug}"
     run_archive_dir_path = os.path.join(archive_base_dir, run_archive_dir_name)
@@ -89,7 +107,7 @@ def main():
         # Initialize log file for this run
         log_to_file(f"--- AI Report Generator Run Start ({timestamp}) ---")
         log_to_file(f"Run CWD: {os.getcwd()}")
-        log_to_file(f"Args: {vars(args)}")
+        log_to_file(f"Args: {_jdump(vars(args))}")
         log_to_file(f"Env Config Keys Loaded: {list(env_config.keys())}") # Log env_config keys
         log_to_file(f"Model Config Keys Loaded: {list(models_config.keys())}") # Log models_config keys
     except OSError as e:
@@ -98,6 +116,27 @@ def main():
         set_run_archive_dir(None)
         log_to_file("Error: Failed to create archive directory. Archiving disabled for this run.")
 
+    # --- Pre-flight Checks ---
+    # Fail fast before any scraping/discovery work: a dead LLM endpoint or
+    # missing search keys would otherwise surface only after minutes of
+    # wasted effort in the summarization or discovery steps.
+    print(f"Probing LLM endpoint for '{final_model_key}'...")
+    if not probe_model(env_config):
+        print(f"Error: LLM endpoint for '{final_model_key}' is unreachable or misconfigured. "
+              f"Check api_endpoint/api_key in ai_models.yml before running.")
+        log_to_file(f"Run Error: Pre-flight model probe failed for '{final_model_key}'. Aborting.")
+        exit(1)
+    print("LLM endpoint reachable.")
+
+    if not args.no_search:
+        google_ok = env_config.get("google_api_key") and env_config.get("google_cse_id")
+        brave_ok = env_config.get("brave_api_key")
+        if not google_ok and not brave_ok:
+            print("Error: Web search is enabled but neither Google (API Key + CSE ID) nor Brave API Key is configured. "
+                  "Set keys in .env or rerun with --no-search and offline sources.")
+            log_to_file("Run Error: Pre-flight search key check failed (no Google/Brave keys). Aborting.")
+            exit(1)
+    # --- End Pre-flight Checks ---
 
     # --- Workflow Steps ---
     try:
@@ -121,7 +160,7 @@ def main():
                 if file_ext == '.txt':
                     # Handle as URL list (original behavior)
                     with open(args.direct_articles, 'r', encoding='utf-8') as f:
-                        direct_article_urls = [line.strip() for line in f if line.strip() and line.strip().startswith(('http://', 'https://'))]
+                        direct_article_urls = [line.strip() for line in f if line.strip() and _URL_RE.match(line.strip())]
                     if direct_article_urls:
                         print(f"Successfully loaded {len(direct_article_urls)} direct article URLs.")
                         log_to_file(f"Loaded {len(direct_article_urls)} direct URLs: {direct_article_urls}")
@@ -166,6 +205,14 @@ def main():
                  print("No direct articles provided via --direct-articles. Skipping scraping phase.")
                  log_to_file("Source Determination: No direct articles provided. Skipping scraping phase.")
             # Argument parser already ensures we have *some* offline content (direct_articles OR reference_docs OR reference_docs_folder)
+        elif len(direct_article_urls) >= args.min_sources and reference_docs_content:
+            # Opportunistic short-circuit: a pre-curated URL list already at or
+            # above --min-sources plus loaded reference docs covers the content
+            # need, so the AI discovery call and its follow-on search API
+            # round-trips would only add latency and cost.
+            print(f"Skipping source discovery: {len(direct_article_urls)} direct URLs (>= --min-sources {args.min_sources}) plus reference docs already loaded.")
+            log_to_file(f"Source Determination: Discovery skipped: {len(direct_article_urls)} direct URLs + reference docs satisfy --min-sources ({args.min_sources}).")
+            sources_for_scraping = direct_article_urls
         else:
             # Search is active, discover sources if needed
             print("Discovering sources via AI and combining with direct articles (if any)...")
@@ -185,15 +232,13 @@ def main():
 
             # Combine and deduplicate sources for scraping
             combined_sources = direct_article_urls + discovered_sources + direct_keyword_search_urls # Prioritize direct URLs, then AI, then direct keyword search
-            seen_sources = set()
-            unique_combined_sources = []
+            # Dict insertion order (Python 3.7+) gives first-seen-wins dedup in
+            # one pass; keys are URL-normalized so scheme-case, trailing-slash
+            # and fragment-only variants collapse to a single scrape
+            deduped_sources = {}
             for src in combined_sources:
-                normalized_src = src # Keep original for now, simple exact match dedupe
-                if normalized_src not in seen_sources:
-                    unique_combined_sources.append(src)
-                    seen_sources.add(normalized_src)
-
-            sources_for_scraping = unique_combined_sources
+                deduped_sources.setdefault(_norm_source_key(src), src)
+            sources_for_scraping = list(deduped_sources.values())
             print(f"Combined sources for scraping: {len(sources_for_scraping)} unique sources/URLs.")
             log_to_file(f"Source Determination: Combined {len(discovered_sources)} discovered sources, {len(direct_article_urls)} direct URLs, and {len(direct_keyword_search_urls)} direct keyword search URLs, resulting in {len(sources_for_scraping)} unique items for scraping.")
 
@@ -333,23 +378,29 @@ def main():
 
 
 if __name__ == "__main__":
-    # Ensure necessary libraries are installed
-    try:
-        import newspaper # newspaper4k
-        import selenium
-        from webdriver_manager.chrome import ChromeDriverManager
-        import PyPDF2
-        import docx
-        import requests
-        import yaml
-        import dotenv
-        import bs4
-        import markdown
-        import pdfkit
-    except ImportError as e:
-        print(f"\nImport Error: {e}. One or more required libraries are missing.")
+    # Ensure necessary libraries are installed. find_spec only checks that the
+    # package is resolvable - actually importing selenium/newspaper here would
+    # add seconds of cold-start cost to every invocation, even ones that never
+    # scrape (the heavy modules are lazily imported where they're used).
+    import importlib.util
+    required_modules = [
+        "newspaper", # newspaper4k
+        "selenium",
+        "webdriver_manager",
+        "pypdfium2",
+        "docx",
+        "requests",
+        "yaml",
+        "dotenv",
+        "bs4",
+        "markdown",
+        "weasyprint",
+    ]
+    missing_modules = [m for m in required_modules if importlib.util.find_spec(m) is None]
+    if missing_modules:
+        print(f"\nImport Error: missing required libraries: {', '.join(missing_modules)}.")
         print("Please ensure all dependencies are installed. You might need to run:")
-        print("pip install newspaper4k selenium webdriver-manager python-dotenv PyYAML requests beautifulsoup4 pypdf python-docx markdown pdfkit")
+        print("pip install newspaper4k selenium webdriver-manager python-dotenv PyYAML requests beautifulsoup4 pypdfium2 python-docx markdown weasyprint")
         print("\nAlternatively, check your Python environment and interpreter.")
         exit(1)
 
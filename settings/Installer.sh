@@ -300,7 +300,7 @@ print_info "Core prerequisites check complete."
 echo
 
 # --- Setup Host Python Environment ---
-# Moved earlier to ensure venv exists before Chrome/ChromeDriver/wkhtmltopdf install steps
+# Moved earlier to ensure venv exists before Chrome/ChromeDriver/WeasyPrint dependency install steps
 print_info "Setting up Python virtual environment ('host_venv') for report_builder.py..."
 
 # Determine expected activation script path first
@@ -709,293 +709,117 @@ else
 fi
 echo
 
-# --- Install wkhtmltopdf ---
-print_info "Checking wkhtmltopdf installation..."
-
-install_wkhtmltopdf() {
-    if command -v wkhtmltopdf &> /dev/null; then
-        print_info "wkhtmltopdf is already installed."
+# --- Install WeasyPrint System Libraries ---
+print_info "Checking WeasyPrint system libraries (Pango/Cairo)..."
+
+install_weasyprint_deps() {
+    # The WeasyPrint Python package itself comes from requirements_host.txt;
+    # PDF rendering additionally needs the native Pango/Cairo/GDK-PixBuf
+    # stack, which pip does not provide.
+    local venv_python="./host_venv/bin/python"
+    [ -x "$venv_python" ] || venv_python="$PYTHON_CMD"
+    if "$venv_python" -c "import weasyprint" &> /dev/null; then
+        print_info "WeasyPrint imports successfully; system libraries already present."
         return 0
     fi
 
-    print_info "Installing wkhtmltopdf..."
+    print_info "Installing WeasyPrint system libraries..."
 
     case "$OS_ID" in
         debian|ubuntu)
-            # First attempt: Try installing via apt
-            print_info "Attempting to install wkhtmltopdf via apt..."
-            if sudo apt-get update && sudo apt-get install -y wkhtmltopdf; then
-                print_info "Successfully installed wkhtmltopdf via apt"
-                return 0
-            fi
-
-            print_warning "apt installation failed, attempting manual installation..."
-
-            local version=""
-            local arch="amd64"
-            local success=false
-
-            # First try matching version-specific package
-            case "$VERSION_ID" in
-                "12"|"bookworm") version="0.12.7-1.bookworm";;
-                "11"|"bullseye") version="0.12.7-1.bullseye";;
-                "10"|"buster") version="0.12.7-1.buster";;
-                "24.04"|"noble") version="0.12.7-1.jammy";; # Try jammy package for noble
-                "23.10"|"mantic") version="0.12.7-1.jammy";; # Try jammy package for mantic
-                "23.04"|"lunar") version="0.12.7-1.jammy";; # Try jammy package for lunar
-                "22.10"|"kinetic") version="0.12.7-1.jammy";; # Try jammy package for kinetic
-                "22.04"|"jammy") version="0.12.7-1.jammy";;
-                "20.04"|"focal") version="0.12.7-1.focal";;
-                "18.04"|"bionic") version="0.12.7-1.bionic";;
-                *)
-                    # For unknown versions, try using the package for the latest LTS
-                    print_warning "Unknown Debian/Ubuntu version: $VERSION_ID, attempting with jammy package..."
-                    version="0.12.7-1.jammy"
-                    ;;
-            esac
-
-            local download_url="https://github.com/wkhtmltopdf/packaging/releases/download/0.12.7-1/wkhtmltox_${version}_${arch}.deb"
-            local temp_deb="/tmp/wkhtmltopdf.deb"
-
-            print_info "Downloading wkhtmltopdf package from: $download_url"
-            if wget -q -O "$temp_deb" "$download_url"; then
-                print_info "Installing downloaded wkhtmltopdf package..."
-                if sudo dpkg -i "$temp_deb"; then
-                    success=true
-                else
-                    print_warning "dpkg installation failed, attempting to fix dependencies..."
-                    if sudo apt-get install -f -y && sudo dpkg -i "$temp_deb"; then
-                        success=true
-                    fi
-                fi
-                rm -f "$temp_deb"
-            fi
-
-            if [ "$success" = true ]; then
-                print_info "Successfully installed wkhtmltopdf from downloaded package"
-                return 0
+            print_info "Attempting to install Pango/Cairo libraries via apt..."
+            if sudo apt-get update && sudo apt-get install -y libpango-1.0-0 libpangoft2-1.0-0 libcairo2 libgdk-pixbuf-2.0-0 libffi8 shared-mime-info fonts-dejavu-core; then
+                print_info "Successfully installed WeasyPrint system libraries via apt"
             else
-                print_error "Failed to install wkhtmltopdf automatically."
-                echo
-                echo "Please try installing manually using one of these methods:"
-                echo "1. Using apt (recommended):"
-                echo "   sudo apt-get update"
-                echo "   sudo apt-get install -y wkhtmltopdf"
+                print_error "Failed to install WeasyPrint system libraries via apt."
                 echo
-                echo "2. Download from official website:"
-                echo "   Visit https://wkhtmltopdf.org/downloads.html"
-                echo "   Download and install the appropriate package for your system"
+                echo "Please try installing manually:"
+                echo "   sudo apt-get install -y libpango-1.0-0 libpangoft2-1.0-0 libcairo2 libgdk-pixbuf-2.0-0"
                 echo
                 return 1
             fi
             ;;
 
         fedora|centos|rhel|almalinux)
-            # First attempt: Try installing via package manager
             local pkg_cmd=""
             if command -v dnf &> /dev/null; then
-                pkg_cmd="sudo dnf install -y wkhtmltopdf"
+                pkg_cmd="sudo dnf install -y"
             elif command -v yum &> /dev/null; then
-                pkg_cmd="sudo yum install -y wkhtmltopdf"
+                pkg_cmd="sudo yum install -y"
             fi
 
             if [ -n "$pkg_cmd" ]; then
-                print_info "Attempting to install wkhtmltopdf via package manager..."
-                if $pkg_cmd; then
-                    print_info "Successfully installed wkhtmltopdf via package manager"
-                    return 0
-                fi
-                print_warning "Package manager installation failed, attempting manual installation..."
-            fi
-
-            local arch="x86_64"
-            local version="0.12.7-1"
-            local success=false
-
-            # Determine specific version based on OS and version
-            if [[ "$OS_ID" == "almalinux" ]]; then
-                if [[ "$VERSION_ID" == "9" ]]; then
-                    version="0.12.7-1.almalinux9"
-                elif [[ "$VERSION_ID" == "8" ]]; then
-                    version="0.12.7-1.almalinux8"
-                else
-                    version="0.12.7-1.almalinux9" # Try latest for unknown versions
-                fi
-            elif [[ "$OS_ID" == "centos" ]]; then
-                if [[ "$VERSION_ID" == "7" ]]; then
-                    version="0.12.7-1.centos7"
-                elif [[ "$VERSION_ID" == "6" ]]; then
-                    version="0.12.7-1.centos6"
+                print_info "Attempting to install Pango/Cairo libraries via package manager..."
+                if $pkg_cmd pango cairo gdk-pixbuf2 libffi shared-mime-info dejavu-sans-fonts; then
+                    print_info "Successfully installed WeasyPrint system libraries via package manager"
                 else
-                    version="0.12.7-1.centos7" # Try latest for unknown versions
-                fi
-            elif [[ "$OS_ID" == "fedora" ]]; then
-                version="0.12.7-1.fedora" # Generic Fedora package
-            fi
-
-            local download_url="https://github.com/wkhtmltopdf/packaging/releases/download/0.12.7-1/wkhtmltox-${version}.${arch}.rpm"
-            local temp_rpm="/tmp/wkhtmltopdf.rpm"
-
-            print_info "Downloading wkhtmltopdf package from: $download_url"
-            if wget -q -O "$temp_rpm" "$download_url"; then
-                print_info "Installing downloaded wkhtmltopdf package..."
-                if sudo rpm -Uvh "$temp_rpm"; then
-                    success=true
+                    print_error "Failed to install WeasyPrint system libraries automatically."
+                    echo
+                    echo "Please try installing manually:"
+                    echo "   sudo dnf install pango cairo gdk-pixbuf2"
+                    echo
+                    return 1
                 fi
-                rm -f "$temp_rpm"
-            fi
-
-            if [ "$success" = true ]; then
-                print_info "Successfully installed wkhtmltopdf from downloaded package"
-                return 0
             else
-                print_error "Failed to install wkhtmltopdf automatically."
-                echo
-                echo "Please try installing manually using one of these methods:"
-                echo "1. Using package manager (recommended):"
-                if command -v dnf &> /dev/null; then
-                    echo "   sudo dnf install wkhtmltopdf"
-                else
-                    echo "   sudo yum install wkhtmltopdf"
-                fi
-                echo
-                echo "2. Download from official website:"
-                echo "   Visit https://wkhtmltopdf.org/downloads.html"
-                echo "   Download and install the appropriate package for your system"
-                echo
+                print_error "Neither dnf nor yum found. Please install pango, cairo and gdk-pixbuf2 manually."
                 return 1
             fi
             ;;
 
         opensuse*|"sles")
-            local success=false
-            print_info "Attempting to install wkhtmltopdf via zypper..."
-
-            # First attempt: Try installing via zypper
-            if sudo zypper install -y wkhtmltopdf; then
-                success=true
-            else
-                print_warning "zypper installation failed, attempting alternative installation..."
-
-                # Try manual RPM installation as fallback
-                local arch="x86_64"
-                local version="0.12.7-1.opensuse"
-                local download_url="https://github.com/wkhtmltopdf/packaging/releases/download/0.12.7-1/wkhtmltox-${version}.${arch}.rpm"
-                local temp_rpm="/tmp/wkhtmltopdf.rpm"
-
-                print_info "Downloading wkhtmltopdf from: $download_url"
-                if wget -q -O "$temp_rpm" "$download_url"; then
-                    print_info "Installing downloaded wkhtmltopdf package..."
-                    if sudo rpm -Uvh "$temp_rpm"; then
-                        success=true
-                    fi
-                fi
-                rm -f "$temp_rpm" 2>/dev/null
-            fi
-
-            if [ "$success" = true ]; then
-                print_info "Successfully installed wkhtmltopdf"
-                return 0
+            print_info "Attempting to install Pango/Cairo libraries via zypper..."
+            if sudo zypper install -y libpango-1_0-0 libcairo2 gdk-pixbuf shared-mime-info; then
+                print_info "Successfully installed WeasyPrint system libraries via zypper"
             else
-                print_error "Failed to install wkhtmltopdf automatically."
+                print_error "Failed to install WeasyPrint system libraries via zypper."
                 echo
-                echo "Please try installing manually using one of these methods:"
-                echo "1. Using zypper (recommended):"
-                echo "   sudo zypper install wkhtmltopdf"
-                echo
-                echo "2. Download from official website:"
-                echo "   Visit https://wkhtmltopdf.org/downloads.html"
-                echo "   Download and install the appropriate package for your system"
+                echo "Please try installing manually:"
+                echo "   sudo zypper install libpango-1_0-0 libcairo2 gdk-pixbuf"
                 echo
                 return 1
             fi
             ;;
 
         "arch"|"manjaro"|"endeavouros"|"garuda")
-            local success=false
-            print_info "Checking wkhtmltopdf in Arch repositories..."
-
-            # First attempt: Try official repos
-            if pacman -Si wkhtmltopdf &> /dev/null; then
-                print_info "Found wkhtmltopdf in standard repositories. Installing..."
-                if sudo pacman -S --noconfirm wkhtmltopdf; then
-                    success=true
-                else
-                    print_warning "pacman installation failed."
-                fi
+            print_info "Attempting to install Pango/Cairo libraries via pacman..."
+            if sudo pacman -S --noconfirm --needed pango cairo gdk-pixbuf2 shared-mime-info ttf-dejavu; then
+                print_info "Successfully installed WeasyPrint system libraries via pacman"
             else
-                print_warning "wkhtmltopdf not found in standard Arch repositories."
-            fi
-
-            # If official repos failed, try AUR
-            if [ "$success" = false ]; then
-                local AUR_HELPER=""
-                if command -v yay &> /dev/null; then
-                    AUR_HELPER="yay"
-                elif command -v paru &> /dev/null; then
-                    AUR_HELPER="paru"
-                fi
-
-                if [ -n "$AUR_HELPER" ]; then
-                    print_warning "Detected AUR helper: $AUR_HELPER."
-                    read -p "Do you want to attempt installing 'wkhtmltopdf-static' from the AUR using $AUR_HELPER? [y/N]: " INSTALL_AUR_WKHTMLTOPDF
-                    INSTALL_AUR_WKHTMLTOPDF=$(echo "$INSTALL_AUR_WKHTMLTOPDF" | tr '[:upper:]' '[:lower:]')
-                    if [[ "$INSTALL_AUR_WKHTMLTOPDF" == "y" ]]; then
-                        print_info "Attempting installation via $AUR_HELPER..."
-                        if $AUR_HELPER -S --noconfirm wkhtmltopdf-static; then
-                            success=true
-                        fi
-                    fi
-                fi
-            fi
-
-            if [ "$success" = true ]; then
-                print_info "Successfully installed wkhtmltopdf"
-                return 0
-            else
-                print_error "Failed to install wkhtmltopdf automatically."
-                echo
-                echo "Please try installing manually using one of these methods:"
-                echo "1. Using pacman (if available in official repos):"
-                echo "   sudo pacman -S wkhtmltopdf"
-                echo
-                echo "2. Using AUR (recommended if not in official repos):"
-                echo "   yay -S wkhtmltopdf-static"
-                echo "   # or"
-                echo "   paru -S wkhtmltopdf-static"
+                print_error "Failed to install WeasyPrint system libraries via pacman."
                 echo
-                echo "3. Download from official website:"
-                echo "   Visit https://wkhtmltopdf.org/downloads.html"
-                echo "   Download and install the appropriate package for your system"
+                echo "Please try installing manually:"
+                echo "   sudo pacman -S pango cairo gdk-pixbuf2"
                 echo
                 return 1
             fi
             ;;
 
         *)
-            print_error "Unsupported distribution for automated wkhtmltopdf installation: $OS_ID"
-            print_error "Please install wkhtmltopdf manually from https://wkhtmltopdf.org/downloads.html"
+            print_error "Unsupported distribution for automated WeasyPrint dependency installation: $OS_ID"
+            print_error "Please install the Pango, Cairo and GDK-PixBuf libraries manually."
+            print_error "See https://doc.courtbouillon.org/weasyprint/stable/first_steps.html"
             return 1
             ;;
     esac
 
-    # Verify installation
-    if command -v wkhtmltopdf &> /dev/null; then
-        print_info "wkhtmltopdf installed successfully."
-        print_info "Version: $(wkhtmltopdf --version)"
+    # Verify installation: WeasyPrint imports cleanly only once the native
+    # libraries it links against are present.
+    if "$venv_python" -c "import weasyprint" &> /dev/null; then
+        print_info "WeasyPrint system libraries installed successfully."
         return 0
     else
-        print_error "wkhtmltopdf installation verification failed."
+        print_warning "WeasyPrint still fails to import; PDF generation may not work."
+        print_warning "Reports can still be generated with --no-pdf (markdown only)."
         return 1
     fi
 }
 
-read -p "Do you want to install wkhtmltopdf for PDF report generation? [Y/n]: " INSTALL_WKHTMLTOPDF
-INSTALL_WKHTMLTOPDF=$(echo "$INSTALL_WKHTMLTOPDF" | tr '[:upper:]' '[:lower:]')
-if [[ "$INSTALL_WKHTMLTOPDF" != "n" ]]; then
-    install_wkhtmltopdf
+read -p "Do you want to install the WeasyPrint system libraries for PDF report generation? [Y/n]: " INSTALL_WEASYPRINT_DEPS
+INSTALL_WEASYPRINT_DEPS=$(echo "$INSTALL_WEASYPRINT_DEPS" | tr '[:upper:]' '[:lower:]')
+if [[ "$INSTALL_WEASYPRINT_DEPS" != "n" ]]; then
+    install_weasyprint_deps
 else
-    print_info "Skipping wkhtmltopdf installation."
+    print_info "Skipping WeasyPrint system library installation."
 fi
 echo
 
@@ -1029,7 +853,7 @@ if grep -q Microsoft /proc/version 2>/dev/null; then
     echo
     echo "NOTE: WSL Environment Detected"
     echo "- Chrome/ChromeDriver: Use Windows Chrome installation"
-    echo "- PDF Generation: wkhtmltopdf installed in WSL will work natively"
+    echo "- PDF Generation: WeasyPrint libraries installed in WSL will work natively"
     echo "- Browser automation will use Windows Chrome through WSL integration"
 fi
 echo
@@ -1051,8 +875,8 @@ echo "   - ${ORIGINAL_DIR}/settings/llm_settings/ai_models.yml (if modified)"
 echo
 echo "4. Verify Chrome/Chromium is installed if you rely on Selenium features. This script attempts to install a matching ChromeDriver in ./host_venv/bin/."
 echo
-echo "5. PDF report generation requires wkhtmltopdf. If you did not install it during setup,"
-echo "   install it manually from https://wkhtmltopdf.org/downloads.html"
+echo "5. PDF report generation requires WeasyPrint's Pango/Cairo libraries. If you did not"
+echo "   install them during setup, see https://doc.courtbouillon.org/weasyprint/stable/first_steps.html"
 echo
 echo "6. To deactivate the environment when finished:"
 echo "   deactivate"